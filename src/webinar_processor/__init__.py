@@ -22,22 +22,18 @@ _ = load_dotenv(find_dotenv())
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 
 
-@click.group()
-def cli():
-    """Process Webinar Data"""
+class LazyGroup(click.Group):
+    """Click group that imports each subcommand only when it is looked up."""
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(commands.COMMANDS))
 
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in commands.COMMANDS:
+            return commands.load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
 
-# Add commands
-cli.add_command(commands.download)
-cli.add_command(commands.transcribe)
-cli.add_command(commands.diarize)
-cli.add_command(commands.upload_webinar)
-cli.add_command(commands.summarize)
-cli.add_command(commands.storytell)
-cli.add_command(commands.raw_text)
-cli.add_command(commands.upload_quiz)
-cli.add_command(commands.quiz)
-cli.add_command(commands.tsv_to_transcript)
-cli.add_command(commands.speakers)
-cli.add_command(commands.transcript_verify)
-cli.add_command(commands.transcript_fix)
+
+@click.group(cls=LazyGroup)
+def cli():
+    """Process Webinar Data"""
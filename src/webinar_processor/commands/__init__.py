@@ -1,18 +1,46 @@
-from .cmd_yt_download import download
-from .cmd_transcribe import transcribe, diarize
-from .cmd_upload_webinar import upload_webinar
-from .cmd_summarize import summarize
-from .cmd_storytell import storytell
-from .cmd_raw_text import raw_text
-from .cmd_upload_quiz import upload_quiz
-from .cmd_quiz import quiz
-from .cmd_tsv_to_transcript import tsv_to_transcript
-from .cmd_transcript_verify import transcript_verify
-from .cmd_transcript_fix import transcript_fix
-from .speakers import speakers
-
-
-__all__ = ['download', 'transcribe', 'diarize',
-            'upload_webinar', 'summarize', 'storytell', 'raw_text',
+"""CLI commands, imported on first use.
+
+Command modules pull in heavy dependencies (openai, pytube, torch via
+pyannote), so they are only imported when a command is actually run.
+"""
+
+import importlib
+
+# CLI command name -> (module, attribute)
+COMMANDS = {
+    'download': ('.cmd_yt_download', 'download'),
+    'transcribe': ('.cmd_transcribe', 'transcribe'),
+    'transcribe-batch': ('.cmd_transcribe', 'transcribe_batch'),
+    'diarize': ('.cmd_transcribe', 'diarize'),
+    'upload-webinar': ('.cmd_upload_webinar', 'upload_webinar'),
+    'upload-webinar-batch': ('.cmd_upload_webinar', 'upload_webinar_batch'),
+    'summarize': ('.cmd_summarize', 'summarize'),
+    'storytell': ('.cmd_storytell', 'storytell'),
+    'raw-text': ('.cmd_raw_text', 'raw_text'),
+    'upload-quiz': ('.cmd_upload_quiz', 'upload_quiz'),
+    'quiz': ('.cmd_quiz', 'quiz'),
+    'tsv-to-transcript': ('.cmd_tsv_to_transcript', 'tsv_to_transcript'),
+    'speakers': ('.speakers', 'speakers'),
+    'transcript-verify': ('.cmd_transcript_verify', 'transcript_verify'),
+    'transcript-fix': ('.cmd_transcript_fix', 'transcript_fix'),
+}
+
+
+__all__ = ['download', 'transcribe', 'transcribe_batch', 'diarize',
+            'upload_webinar', 'upload_webinar_batch', 'summarize', 'storytell', 'raw_text',
             'upload_quiz', 'quiz', 'tsv_to_transcript', 'speakers',
             'transcript_verify', 'transcript_fix']
+
+
+def load_command(name: str):
+    """Import and return the click command registered under CLI name."""
+    module_name, attr = COMMANDS[name]
+    return getattr(importlib.import_module(module_name, __name__), attr)
+
+
+def __getattr__(attr: str):
+    # Keep `from webinar_processor.commands import quiz` working.
+    for name, (_module_name, command_attr) in COMMANDS.items():
+        if command_attr == attr:
+            return load_command(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
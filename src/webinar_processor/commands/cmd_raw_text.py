@@ -1,12 +1,12 @@
-import json
 import click
+import orjson
 from webinar_processor.utils.io import write_output
 
 
 @click.command()
-@click.argument('asr_file', type=click.File("r", encoding="utf-8"), nargs=1)
+@click.argument('asr_file', type=click.File("rb"), nargs=1)
 @click.option('--output-file', type=click.Path(exists=False))
 def raw_text(asr_file: click.File, output_file: str):
     """Write raw transcript text."""
-    data = json.load(asr_file)
+    data = orjson.loads(asr_file.read())
     write_output(data["text"], output_file)
@@ -1,10 +1,11 @@
+import itertools
 import json
 
 import click
 from webinar_processor.llm import LLMConfig, LLMError
-from webinar_processor.utils.io import write_output
+from webinar_processor.utils.io import stream_output
 from webinar_processor.services.transcript_service import load_and_format_transcript
-from webinar_processor.services.storytell_service import generate_article
+from webinar_processor.services.storytell_service import iter_article
 
 
 @click.command()
@@ -32,20 +33,24 @@ def storytell(asr_file: str, model: str, output_file: str, no_appendix: bool, si
 
     model = model or LLMConfig.get_model('story')
 
+    # Stream the article to the output as parts arrive. stream_output only
+    # puts the file in place once the article is complete, so a late
+    # failure doesn't leave a half-written story; an empty generation is
+    # reported before anything is written
     try:
-        result = generate_article(
+        chunks = iter_article(
             text, model,
             segments=segments,
             no_appendix=no_appendix,
             single_pass=single_pass,
         )
+        first = next(chunks, None)
+        if first is None:
+            click.echo(click.style("Generation failed", fg='red'))
+            raise click.Abort()
+        result = stream_output(itertools.chain([first], chunks), output_file)
     except LLMError as e:
         click.echo(click.style(f"Error during storytell: {e}", fg='red'))
         raise click.Abort()
 
-    if not result:
-        click.echo(click.style("Generation failed", fg='red'))
-        raise click.Abort()
-
     click.echo(click.style(f"Done: {len(result)} chars", fg='green'))
-    write_output(result, output_file)
@@ -2,9 +2,9 @@ import json
 
 import click
 from webinar_processor.llm import LLMConfig, LLMError
-from webinar_processor.utils.completion import get_completion, get_output_limit
+from webinar_processor.utils.completion import get_output_limit, stream_completion
 from webinar_processor.utils.package import get_config_path
-from webinar_processor.utils.io import load_prompt_template, write_output
+from webinar_processor.utils.io import load_prompt_template, stream_output
 from webinar_processor.services.transcript_service import load_and_format_transcript
 
 
@@ -36,10 +36,12 @@ def summarize(asr_file: str, model: str, output_file: str):
     )
     prompt = prompt_template.format(text=text)
 
+    # Stream tokens straight to the output as they arrive
     try:
-        summary = get_completion(prompt, model, max_tokens=get_output_limit(model))
+        stream_output(
+            stream_completion(prompt, model, max_tokens=get_output_limit(model)),
+            output_file,
+        )
     except LLMError as e:
         click.echo(click.style(f"Error during summarization: {e}", fg='red'))
         raise click.Abort()
-
-    write_output(summary, output_file)
@@ -1,17 +1,45 @@
 import os
-import tempfile
 import click
 import json
+from concurrent.futures import Future
+from typing import Optional
+
+from webinar_processor.services.transcription_service import (
+    asr_skips_silence,
+    diarize_wav,
+    preload_models,
+    transcribe_and_diarize,
+    transcript_cache_key,
+)
+from webinar_processor.utils.cache import load_cached, store_cached
+from webinar_processor.utils.ffmpeg import load_audio, mp4_silence_remove
+from webinar_processor.utils.io import write_json
+
+_CACHE_NAMESPACE = "transcripts"
 
-from webinar_processor.services.transcription_service import diarize_wav, transcribe_wav
-from webinar_processor.utils.ffmpeg import (
-    convert_mp4_to_wav,
-    mp4_silence_remove,
-    get_wav_filename,
-    normalize_audio_file,
+_cache_option = click.option(
+    "--cache/--no-cache",
+    default=True,
+    show_default=True,
+    help="Reuse results for audio that was already transcribed with the same settings.",
 )
 
 
+class _ModelPreload:
+    """Start background model loading at most once, and only when needed."""
+
+    def __init__(self):
+        self._future: Optional[Future] = None
+
+    def start(self) -> None:
+        if self._future is None:
+            self._future = preload_models()
+
+    def wait(self) -> None:
+        self.start()
+        self._future.result()
+
+
 def _resolve_transcript_path(webinar_path: str, transcript_path: str) -> str:
     if transcript_path:
         return transcript_path
@@ -19,6 +47,58 @@ def _resolve_transcript_path(webinar_path: str, transcript_path: str) -> str:
     return os.path.join(transcript_dir, "transcript.json")
 
 
+def _transcribe_file(
+    webinar_path: str,
+    transcript_path: str,
+    language: str,
+    normalize_audio: bool,
+    models: _ModelPreload,
+    use_cache: bool = True,
+) -> str:
+    """Trim, decode, transcribe and diarize one file; return the .asr path."""
+    # Trim video.
+    output_file, ext = os.path.splitext(webinar_path)
+    output_name = output_file + ".stripped" + ext
+
+    # WAV files are already audio-only, no video silence to remove; with
+    # faster-whisper VAD the ASR skips silence itself
+    if os.path.splitext(webinar_path)[1].lower() == ".wav" or asr_skips_silence():
+        output_name = webinar_path
+    else:
+        mp4_silence_remove(webinar_path, output_name)
+
+    # Decode straight to an in-memory waveform; no intermediate WAV file
+    audio = load_audio(output_name, normalize=normalize_audio)
+
+    # Keyed by the decoded samples, so re-muxed or renamed copies also hit
+    cache_key = transcript_cache_key(audio, language) if use_cache else None
+    cached = load_cached(_CACHE_NAMESPACE, cache_key) if cache_key else None
+    asr_path = transcript_path + ".asr"
+    if cached is not None:
+        click.echo(f"Using cached transcript for {webinar_path}")
+        asr_result, result = cached["asr"], cached["transcript"]
+        write_json(asr_path, asr_result)
+    else:
+        models.wait()
+        try:
+            # The .asr file is written as soon as ASR finishes, so a failed
+            # diarization can be retried with `diarize` without redoing ASR
+            asr_result, result = transcribe_and_diarize(
+                audio,
+                language=language,
+                on_asr=lambda asr: write_json(asr_path, asr),
+            )
+        except ValueError as exc:
+            click.echo(click.style(f"Error: {exc}", fg="red"))
+            raise click.Abort() from exc
+
+    write_json(transcript_path, result)
+    # Only after the outputs are safely on disk
+    if cached is None and cache_key:
+        store_cached(_CACHE_NAMESPACE, cache_key, {"asr": asr_result, "transcript": result})
+    return asr_path
+
+
 @click.command()
 @click.argument("webinar_path", nargs=1)
 @click.argument("transcript_path", default="")
@@ -29,54 +109,64 @@ def _resolve_transcript_path(webinar_path: str, transcript_path: str) -> str:
     show_default=True,
     help="Normalize loudness before ASR (recommended for phone-call audio).",
 )
+@_cache_option
 def transcribe(
     webinar_path: str,
     transcript_path: str,
     language: str,
     normalize_audio: bool,
+    cache: bool,
 ):
     """
     Transcribe video file with speaker detection
     """
     transcript_path = _resolve_transcript_path(webinar_path, transcript_path)
 
-    # Trim video.
-    output_file, ext = os.path.splitext(webinar_path)
-    output_name = output_file + ".stripped" + ext
-
-    # WAV files are already audio-only, no video silence to remove
-    if os.path.splitext(webinar_path)[1].lower() == ".wav":
-        output_name = webinar_path
-    else:
-        mp4_silence_remove(webinar_path, output_name)
+    # Without the cache the models are certainly needed: load them in the
+    # background while ffmpeg trims and decodes. With it, wait until the
+    # decoded audio misses the cache so a hit loads nothing.
+    models = _ModelPreload()
+    if not cache:
+        models.start()
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        wav_filename = get_wav_filename(output_name, tmpdir)
-        convert_mp4_to_wav(output_name, wav_filename)
-        asr_audio_path = wav_filename
+    asr_path = _transcribe_file(
+        webinar_path, transcript_path, language, normalize_audio, models, cache
+    )
+    click.echo(asr_path)
 
-        if normalize_audio:
-            normalized_wav = os.path.join(tmpdir, "normalized.wav")
-            normalize_audio_file(wav_filename, normalized_wav)
-            asr_audio_path = normalized_wav
-
-        asr_result = transcribe_wav(asr_audio_path, language=language)
-
-        asr_path = transcript_path + ".asr"
-        with open(asr_path, "w", encoding="utf-8") as json_file:
-            serialized_result = json.dumps(asr_result, indent=4, ensure_ascii=False)
-            json_file.write(serialized_result)
-
-        try:
-            result = diarize_wav(asr_audio_path, asr_result)
-        except ValueError as exc:
-            click.echo(click.style(f"Error: {exc}", fg="red"))
-            raise click.Abort() from exc
 
-        with open(transcript_path, "w", encoding="utf-8") as json_file:
-            serialized_result = json.dumps(result, indent=4, ensure_ascii=False)
-            json_file.write(serialized_result)
+@click.command()
+@click.argument("webinar_paths", nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.option("--language", default="ru", show_default=True, help="Transcript language.")
+@click.option(
+    "--normalize-audio/--no-normalize-audio",
+    default=False,
+    show_default=True,
+    help="Normalize loudness before ASR (recommended for phone-call audio).",
+)
+@_cache_option
+def transcribe_batch(webinar_paths, language: str, normalize_audio: bool, cache: bool):
+    """
+    Transcribe several video files in one process, loading models once.
 
+    Each transcript is written as transcript.json next to its video.
+    """
+    transcript_paths = [_resolve_transcript_path(path, "") for path in webinar_paths]
+    if len(set(transcript_paths)) != len(transcript_paths):
+        raise click.UsageError(
+            "Each video must be in its own directory (transcripts would overwrite each other)"
+        )
+
+    # Models are cached per process, so only the first cache miss pays for
+    # loading
+    models = _ModelPreload()
+    if not cache:
+        models.start()
+
+    for webinar_path, transcript_path in zip(webinar_paths, transcript_paths):
+        asr_path = _transcribe_file(
+            webinar_path, transcript_path, language, normalize_audio, models, cache
+        )
         click.echo(asr_path)
 
 
@@ -87,21 +177,19 @@ def diarize(webinar_path: str, transcript_path: str):
     """
     Diarize video file with speaker detection after transcription
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        wav_filename = get_wav_filename(webinar_path, tmpdir)
-        convert_mp4_to_wav(webinar_path, wav_filename)
+    models_ready = preload_models(asr=False)
+    audio = load_audio(webinar_path)
 
-        with open(transcript_path + ".asr", "r", encoding="utf-8") as json_file:
-            asr_result = json.load(json_file)
+    with open(transcript_path + ".asr", "r", encoding="utf-8") as json_file:
+        asr_result = json.load(json_file)
 
-        try:
-            result = diarize_wav(wav_filename, asr_result)
-        except ValueError as exc:
-            click.echo(click.style(f"Error: {exc}", fg="red"))
-            raise click.Abort() from exc
+    models_ready.result()
+    try:
+        result = diarize_wav(audio, asr_result)
+    except ValueError as exc:
+        click.echo(click.style(f"Error: {exc}", fg="red"))
+        raise click.Abort() from exc
 
-        with open(transcript_path, "w", encoding="utf-8") as json_file:
-            serialized_result = json.dumps(result, indent=4, ensure_ascii=False)
-            json_file.write(serialized_result)
+    write_json(transcript_path, result)
 
-        return asr_result, result
+    return asr_result, result
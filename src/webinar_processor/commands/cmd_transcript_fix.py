@@ -5,6 +5,7 @@ import click
 
 from webinar_processor.llm import LLMConfig, LLMError
 from webinar_processor.services.transcript_fixer_service import fix_transcript
+from webinar_processor.utils.io import write_json
 
 
 @click.command('transcript-fix')
@@ -63,8 +64,7 @@ def transcript_fix(transcript_path, media, report, language, out, fix_report, mo
 
     # Write fixed transcript
     try:
-        with open(out, 'w', encoding='utf-8') as f:
-            json.dump(fixed_segments, f, ensure_ascii=False, indent=2)
+        write_json(out, fixed_segments, indent=2)
         click.echo(click.style(f"Fixed transcript written to {out}", fg='green'))
     except IOError as e:
         click.echo(click.style(f"Error writing output: {e}", fg='red'))
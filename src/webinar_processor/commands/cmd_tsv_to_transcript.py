@@ -1,7 +1,8 @@
 import os
-import json
 import click
 
+from webinar_processor.utils.io import write_json
+
 
 @click.command()
 @click.argument('tsv_file', type=click.File("r", encoding="utf-8"), nargs=1)
@@ -12,7 +13,7 @@ def tsv_to_transcript(tsv_file: click.File,  transcript_path: str):
 
     """
     utterances = []
-    full_text = ""
+    text_parts = []
     for line in tsv_file:
         try:
             start, end, text = line.strip().split("\t")
@@ -22,10 +23,10 @@ def tsv_to_transcript(tsv_file: click.File,  transcript_path: str):
         except ValueError:
             continue
 
-        full_text += text + "\n"
+        text_parts.append(text + "\n")
 
     asr = {
-        "text": full_text,
+        "text": "".join(text_parts),
         "segments": utterances
     }
 
@@ -33,7 +34,5 @@ def tsv_to_transcript(tsv_file: click.File,  transcript_path: str):
         transcript_path = os.path.join(os.path.dirname(tsv_file.name), "transcript.json")
 
 
-    with open(transcript_path, "w", encoding="utf-8") as of:
-        json.dump(utterances, of, ensure_ascii=False, indent=4)
-    with open(transcript_path + ".asr", "w", encoding="utf-8") as of:
-        json.dump(asr, of, ensure_ascii=False, indent=4)
+    write_json(transcript_path, utterances)
+    write_json(transcript_path + ".asr", asr)
@@ -1,7 +1,8 @@
 import os
 import requests
 import click
-from dotenv import load_dotenv, find_dotenv
+
+from webinar_processor.utils.env import load_env
 
 @click.command()
 @click.argument('quiz_file', type=click.File("r", encoding="utf-8"), nargs=1)
@@ -13,7 +14,7 @@ def upload_quiz(quiz_file, slug, endpoint):
     Sends quiz markdown content to the learning platform API for the
     webinar identified by SLUG. Requires EDU_PATH_TOKEN in env.
     """
-    _ = load_dotenv(find_dotenv(usecwd=True))
+    load_env()
     token = os.getenv("EDU_PATH_TOKEN", None)
     if token is None:
         click.echo(click.style('Error: EDU_PATH_TOKEN is not set', fg='red'))
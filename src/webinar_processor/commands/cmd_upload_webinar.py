@@ -1,19 +1,27 @@
+import json
+import mimetypes
 import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import requests
 import click
-from dotenv import load_dotenv, find_dotenv
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder
 
-@click.command()
-@click.option('--title', prompt='Title of the webinar', help='Title of the webinar.')
-@click.option('--slug', prompt='Slug', help='Unique slug for the webinar.')
-@click.option('--poster_file', help='Path to the poster file.', type=click.Path(exists=False), default=None)
-@click.option('--transcript_file', help='Path to the transcript file.', type=click.Path(exists=False), default=None)
-@click.option('--endpoint', help='API endpoint to upload the webinar.', default=None)
-@click.argument('video_file', type=click.Path(exists=True))
-def upload_webinar(video_file, title, slug, poster_file, transcript_file, endpoint):
-    """Upload a Webinar to the specified API endpoint."""
+from webinar_processor.utils.env import load_env
 
-    _ = load_dotenv(find_dotenv(usecwd=True))
+_MANIFEST_REQUIRED = {'video_file', 'title', 'slug'}
+_MANIFEST_OPTIONAL = {'poster_file', 'transcript_file'}
+
+
+def _file_field(path, handle):
+    content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+    return (os.path.basename(path), handle, content_type)
+
+
+def _resolve_credentials(endpoint):
+    load_env()
     token = os.getenv("EDU_PATH_TOKEN", None)
     if token is None:
         click.echo(click.style('Error: EDU_PATH_TOKEN is not set', fg='red'))
@@ -26,6 +34,18 @@ def upload_webinar(video_file, title, slug, poster_file, transcript_file, endpoi
         click.echo(click.style('Error: No endpoint. Set --endpoint or EDU_PATH_API_ENDPOINT.', fg='red'))
         raise click.Abort()
 
+    return token, endpoint
+
+
+def _read_optional(video_dir, names, name):
+    if name not in names:
+        return ""
+    return Path(video_dir, name).read_text(encoding="utf-8")
+
+
+def _post_webinar(session, endpoint, token, video_file, title, slug,
+                  poster_file=None, transcript_file=None):
+    """Upload one webinar with its poster, transcript, summary and story."""
     video_dir = os.path.dirname(video_file)
     if poster_file is None:
         poster_file = os.path.join(video_dir, "posters", "poster.jpg")
@@ -38,39 +58,104 @@ def upload_webinar(video_file, title, slug, poster_file, transcript_file, endpoi
         'Authorization': f'Bearer {token}',
     }
 
-    summary = ""
-    summary_path = os.path.join(video_dir, "summary.txt")
-    if os.path.exists(summary_path):
-        with open(summary_path, "r", encoding="utf-8") as f:
-            summary = f.read()
-
-    long_summary = ""
-    story_path = os.path.join(video_dir, "story.txt")
-    if os.path.exists(story_path):
-        with open(story_path, "r", encoding="utf-8") as f:
-            long_summary = f.read()
+    # One directory listing instead of a stat per optional file; matters
+    # when uploading from network storage
+    with os.scandir(video_dir or os.curdir) as entries:
+        names = {entry.name for entry in entries}
 
     # Prepare data payload
     data = {
         'title': title,
-        'summary': summary,
-        'long_summary': long_summary,
+        'summary': _read_optional(video_dir, names, "summary.txt"),
+        'long_summary': _read_optional(video_dir, names, "story.txt"),
         'slug': slug,
     }
 
-    # Prepare and send with proper file handle cleanup
+    # Stream the multipart body from disk; requests would otherwise build
+    # the whole (multi-GB) body in memory before sending
     with open(video_file, 'rb') as vf, \
          open(poster_file, 'rb') as pf, \
          open(transcript_file, 'rb') as tf:
-        files = {
-            'video_file': (os.path.basename(video_file), vf),
-            'poster_file': (os.path.basename(poster_file), pf),
-            'transcript_file': (os.path.basename(transcript_file), tf),
-        }
+        encoder = MultipartEncoder(fields={
+            **data,
+            'video_file': _file_field(video_file, vf),
+            'poster_file': _file_field(poster_file, pf),
+            'transcript_file': _file_field(transcript_file, tf),
+        })
+        headers['Content-Type'] = encoder.content_type
+
+        return session.post(endpoint, headers=headers, data=encoder)
 
-        response = requests.post(endpoint, headers=headers, files=files, data=data)
+
+@click.command()
+@click.option('--title', prompt='Title of the webinar', help='Title of the webinar.')
+@click.option('--slug', prompt='Slug', help='Unique slug for the webinar.')
+@click.option('--poster_file', help='Path to the poster file.', type=click.Path(exists=False), default=None)
+@click.option('--transcript_file', help='Path to the transcript file.', type=click.Path(exists=False), default=None)
+@click.option('--endpoint', help='API endpoint to upload the webinar.', default=None)
+@click.argument('video_file', type=click.Path(exists=True))
+def upload_webinar(video_file, title, slug, poster_file, transcript_file, endpoint):
+    """Upload a Webinar to the specified API endpoint."""
+    token, endpoint = _resolve_credentials(endpoint)
+
+    with requests.Session() as session:
+        response = _post_webinar(session, endpoint, token, video_file, title, slug,
+                                 poster_file, transcript_file)
 
     if response.status_code == 201:
         click.echo(click.style('Webinar successfully uploaded!', fg='green'))
     else:
-        click.echo(click.style(f'Failed to upload the Webinar! Response: {response.text}', fg='red'))
\ No newline at end of file
+        click.echo(click.style(f'Failed to upload the Webinar! Response: {response.text}', fg='red'))
+
+
+@click.command()
+@click.argument('manifest', type=click.File("r", encoding="utf-8"))
+@click.option('--endpoint', help='API endpoint to upload the webinars.', default=None)
+@click.option('--workers', default=2, show_default=True, type=click.IntRange(min=1),
+              help='Number of uploads to run at the same time.')
+def upload_webinar_batch(manifest, endpoint, workers):
+    """Upload several webinars listed in a JSONL manifest.
+
+    Each line is an object with video_file, title and slug, and optionally
+    poster_file and transcript_file. Uploads run in parallel over one
+    keep-alive session.
+    """
+    try:
+        entries = [json.loads(line) for line in manifest if line.strip()]
+    except json.JSONDecodeError as e:
+        raise click.UsageError(f"Invalid manifest line: {e}")
+
+    for entry in entries:
+        missing = _MANIFEST_REQUIRED - entry.keys()
+        if missing:
+            raise click.UsageError(f"Manifest entry {entry} is missing: {', '.join(sorted(missing))}")
+        unknown = entry.keys() - _MANIFEST_REQUIRED - _MANIFEST_OPTIONAL
+        if unknown:
+            raise click.UsageError(f"Manifest entry {entry} has unknown keys: {', '.join(sorted(unknown))}")
+
+    token, endpoint = _resolve_credentials(endpoint)
+
+    def upload(entry):
+        try:
+            return _post_webinar(session, endpoint, token, **entry)
+        except (OSError, requests.RequestException) as e:
+            return e
+
+    failed = 0
+    with requests.Session() as session:
+        adapter = HTTPAdapter(pool_maxsize=workers)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for entry, result in zip(entries, executor.map(upload, entries)):
+                if isinstance(result, Exception):
+                    failed += 1
+                    click.echo(click.style(f"{entry['slug']}: {result}", fg='red'))
+                elif result.status_code == 201:
+                    click.echo(click.style(f"{entry['slug']}: uploaded", fg='green'))
+                else:
+                    failed += 1
+                    click.echo(click.style(f"{entry['slug']}: failed! Response: {result.text}", fg='red'))
+
+    if failed:
+        raise click.ClickException(f"{failed} of {len(entries)} uploads failed")
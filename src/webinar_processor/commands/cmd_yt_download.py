@@ -2,12 +2,32 @@
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
 import click
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from pytube import YouTube
 
 
+def _make_session() -> requests.Session:
+    """Keep-alive session with a small connection pool and retries on transient errors."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=8,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _make_session()
+
+
 @click.command()
 @click.argument('url', nargs=1)
 @click.option('--output-dir', '-o', default=None, help='Output directory for downloaded video')
@@ -21,23 +41,35 @@ def download(url: str, output_dir: str):
         click.echo("Invalid YouTube URL", err=True)
         sys.exit(1)
         
-    video_path = yt.streams \
+    stream = yt.streams \
         .filter(progressive=True, file_extension='mp4') \
         .order_by('resolution') \
         .desc() \
-        .first() \
-        .download(output_dir)
-    
+        .first()
+
     # download poster
     posters_path = os.path.join(output_dir, "posters") if output_dir else "posters"
-    if not os.path.exists(posters_path):
-        os.makedirs(posters_path)
+    os.makedirs(posters_path, exist_ok=True)
 
     file_name = "poster.jpg"
     file_path = os.path.join(posters_path, file_name)
-    response = requests.get(yt.thumbnail_url)
 
-    with open(file_path, 'wb') as file:
-        file.write(response.content)
+    # Video and poster are independent transfers; fetch them side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        video_future = executor.submit(stream.download, output_dir)
+        poster_future = executor.submit(_download_poster, yt.thumbnail_url, file_path)
+        video_path = video_future.result()
+        poster_future.result()
+
+    click.echo(video_path)
 
-    click.echo(video_path)
\ No newline at end of file
+
+def _download_poster(url: str, file_path: str) -> None:
+    """Stream the thumbnail to disk without holding it in memory."""
+    response = _SESSION.get(url, stream=True)
+    try:
+        with open(file_path, 'wb') as file:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                file.write(chunk)
+    finally:
+        response.close()
@@ -5,7 +5,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Tuple
 
-from webinar_processor.services.voice_embedding_service import VoiceEmbeddingService
 from webinar_processor.utils.embedding_codec import encode_embedding
 
 
@@ -178,6 +177,7 @@ def analyze(directory: str, gap_threshold: float, min_duration: float, max_durat
         click.echo(f"  {speaker}: {len(samples)} samples, {total_duration:.1f}s total")
     
     # Initialize services
+    from webinar_processor.services.voice_embedding_service import VoiceEmbeddingService
     voice_service = VoiceEmbeddingService()
     
     # Build analysis data structure
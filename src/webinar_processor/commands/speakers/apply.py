@@ -2,6 +2,8 @@ import click
 import json
 import os
 
+from webinar_processor.utils.io import write_json
+
 
 @click.command('apply')
 @click.argument('directory', type=click.Path(exists=True, file_okay=False))
@@ -91,8 +93,7 @@ def apply(directory: str, output_suffix: str):
         output_path = transcript_path + '.labeled'
     
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(transcript, f, indent=2, ensure_ascii=False)
+        write_json(output_path, transcript, indent=2)
     except Exception as e:
         click.echo(f"Error writing output: {e}", err=True)
         raise click.Abort()
@@ -7,6 +7,7 @@ from typing import List, Dict, Optional
 
 from webinar_processor.llm import LLMError
 from webinar_processor.services.speaker_name_extractor import extract_speaker_name
+from webinar_processor.utils.io import write_json
 
 import logging
 logger = logging.getLogger(__name__)
@@ -161,8 +162,7 @@ def relabel(transcript_path: str, audio_path: str, output_path: Optional[str],
             else:
                 dest = transcript_path + '.relabeled'
 
-            with open(dest, 'w', encoding='utf-8') as f:
-                json.dump(transcript, f, indent=4, ensure_ascii=False)
+            write_json(dest, transcript)
             click.echo(f"Updated transcript saved to {dest}")
             click.echo(f"Created {new_speaker_count} new speaker entries")
         else:
@@ -1,5 +1,5 @@
 import openai
-from typing import Optional
+from typing import Dict, Iterator, List, Optional
 import logging
 
 from .config import LLMConfig
@@ -18,22 +18,22 @@ class LLMClient:
             base_url=LLMConfig.get_base_url()
         )
 
-    def generate(self, prompt: str, model: Optional[str] = None, max_tokens: int = 100) -> Optional[str]:
+    def generate(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        max_tokens: int = 100,
+        system: Optional[str] = None,
+    ) -> Optional[str]:
         if model is None:
             model = LLMConfig.get_model('default')
 
-        # Check token limit before making API call (prompt + completion must fit)
-        token_limit = TOKEN_LIMITS.get(model, 128000)
-        prompt_tokens = count_tokens(model, prompt)
-        if prompt_tokens + max_tokens > token_limit:
-            raise TokenLimitError(
-                f"Prompt exceeds token limit: {prompt_tokens} + {max_tokens} = {prompt_tokens + max_tokens} > {token_limit} for model {model}"
-            )
+        self._check_token_limit(prompt, model, max_tokens, system)
 
         try:
             response = self.client.chat.completions.create(
                 model=model,
-                messages=[{"role": "user", "content": prompt}],
+                messages=self._build_messages(prompt, system),
                 max_completion_tokens=max_tokens,
             )
             content = response.choices[0].message.content
@@ -46,3 +46,66 @@ class LLMClient:
             logger.error(f"LLM error for model {model}: {e}")
             raise LLMError(f"LLM generation failed for model {model}: {e}") from e
 
+    def stream(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        max_tokens: int = 100,
+        system: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Start a streaming completion and return an iterator of text deltas.
+
+        The request is sent before this method returns, so API and network
+        errors on connect raise LLMError here rather than during iteration.
+        """
+        if model is None:
+            model = LLMConfig.get_model('default')
+
+        self._check_token_limit(prompt, model, max_tokens, system)
+
+        try:
+            response = self.client.chat.completions.create(
+                model=model,
+                messages=self._build_messages(prompt, system),
+                max_completion_tokens=max_tokens,
+                stream=True,
+            )
+        except Exception as e:
+            logger.error(f"LLM error for model {model}: {e}")
+            raise LLMError(f"LLM generation failed for model {model}: {e}") from e
+
+        return self._iter_deltas(response, model)
+
+    @staticmethod
+    def _iter_deltas(response, model: str) -> Iterator[str]:
+        try:
+            for chunk in response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+        except Exception as e:
+            logger.error(f"LLM stream error for model {model}: {e}")
+            raise LLMError(f"LLM stream failed for model {model}: {e}") from e
+
+    @staticmethod
+    def _build_messages(prompt: str, system: Optional[str]) -> List[Dict[str, str]]:
+        # A static system message goes first so provider-side prefix caching
+        # can reuse it across calls whose user content differs
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def _check_token_limit(self, prompt: str, model: str, max_tokens: int, system: Optional[str] = None) -> None:
+        # Check token limit before making API call (prompt + completion must fit)
+        token_limit = TOKEN_LIMITS.get(model, 128000)
+        prompt_tokens = count_tokens(model, prompt)
+        if system:
+            prompt_tokens += count_tokens(model, system)
+        if prompt_tokens + max_tokens > token_limit:
+            raise TokenLimitError(
+                f"Prompt exceeds token limit: {prompt_tokens} + {max_tokens} = {prompt_tokens + max_tokens} > {token_limit} for model {model}"
+            )
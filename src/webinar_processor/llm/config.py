@@ -40,6 +40,14 @@ class LLMConfig:
         # Fall back to hardcoded defaults
         return _DEFAULT_MODELS.get(task, _DEFAULT_MODELS['default'])
 
+    @classmethod
+    def get_max_concurrency(cls) -> int:
+        """Get the maximum number of LLM requests to run in parallel."""
+        try:
+            return max(1, int(os.getenv('LLM_MAX_CONCURRENCY', '4')))
+        except ValueError:
+            return 4
+
     @classmethod
     def validate(cls):
         if not cls.get_api_key():
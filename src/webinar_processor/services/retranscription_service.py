@@ -1,9 +1,16 @@
 """Retranscription service: Whisper + Qwen3-ASR wrappers."""
 
 import logging
+from typing import TYPE_CHECKING, Union
+
+from webinar_processor.services.transcription_service import whisper_decode_options
+
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
+AUDIO_SAMPLE_RATE = 16000
 LANGUAGE_MAP = {
     "ru": "Russian",
     "en": "English",
@@ -43,17 +50,22 @@ class RetranscriptionService:
             logger.info("Qwen3-ASR model loaded")
         return self._qwen3_model
 
-    def transcribe_whisper(self, wav_path: str) -> str:
+    def transcribe_whisper(self, audio: Union[str, "np.ndarray"]) -> str:
+        """Transcribe a WAV path or a 16 kHz mono float32 waveform."""
         model = self._load_whisper()
-        result = model.transcribe(wav_path, language=self.language)
+        result = model.transcribe(audio, language=self.language, **whisper_decode_options(model))
         return result["text"].strip()
 
-    def transcribe_qwen3(self, wav_path: str) -> str:
+    def transcribe_qwen3(self, audio: Union[str, "np.ndarray"]) -> str:
+        """Transcribe a WAV path or a 16 kHz mono float32 waveform."""
         model = self._load_qwen3()
         lang_name = LANGUAGE_MAP.get(self.language, self.language)
 
+        # qwen-asr takes in-memory audio as a (waveform, sample_rate) pair
+        if not isinstance(audio, str):
+            audio = (audio, AUDIO_SAMPLE_RATE)
         result = model.transcribe(
-            audio=wav_path,
+            audio=audio,
             language=lang_name,
             return_time_stamps=False,
         )
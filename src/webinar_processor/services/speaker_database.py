@@ -17,7 +17,7 @@ class SpeakerDatabase:
         if db_path is None:
             home_dir = Path.home()
             db_dir = home_dir / ".webinar_processor"
-            db_dir.mkdir(exist_ok=True)
+            db_dir.mkdir(parents=True, exist_ok=True)
             db_path = str(db_dir / "speakers.db")
 
         self.db_path = db_path
@@ -9,16 +9,29 @@ Three strategies for transforming transcripts into educational articles:
 import json
 import re
 import logging
-from typing import Optional
+from typing import Iterator, Optional
+
+import numpy as np
 
 from webinar_processor.llm import LLMError, TOKEN_LIMITS
-from webinar_processor.utils.completion import get_completion, get_output_limit
-from webinar_processor.utils.io import load_prompt_template
+from webinar_processor.utils.completion import (
+    get_completion,
+    get_output_limit,
+    run_concurrently,
+    stream_completion,
+)
+from webinar_processor.utils.io import compile_template, load_prompt_template
 from webinar_processor.utils.package import get_config_path
-from webinar_processor.utils.token import count_tokens
+from webinar_processor.utils.token import count_tokens, count_tokens_batch
 
 logger = logging.getLogger(__name__)
 
+# Zero-width split after sentence ends and line breaks; joining the pieces
+# reproduces the original text exactly.
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?…\n])(?=\s)')
+# Same, between words; used to hard-split text with no sentence ends.
+_WORD_BOUNDARY = re.compile(r'(?<=\S)(?=\s)')
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -46,6 +59,27 @@ def generate_article(
     Returns:
         Generated article text, or None on failure
     """
+    article = ''.join(iter_article(text, model, segments, no_appendix, single_pass))
+    return article or None
+
+
+def iter_article(
+    text: str,
+    model: str,
+    segments: Optional[list] = None,
+    no_appendix: bool = False,
+    single_pass: bool = False,
+) -> Iterator[str]:
+    """
+    Generate an educational article, yielding text as it is produced.
+
+    Single-pass output streams token by token; the outline strategy yields
+    each section once it is written. Yields nothing if generation fails.
+    Arguments are the same as for generate_article.
+
+    Raises:
+        LLMError: If a required LLM call fails
+    """
     text_tokens = count_tokens(model, text)
     token_limit = TOKEN_LIMITS.get(model, 128000)
     output_limit = get_output_limit(model)
@@ -60,23 +94,23 @@ def generate_article(
     # Choose generation strategy
     if single_pass:
         logger.info("Single-pass mode...")
-        return _storytell_single_pass(text, model)
+        yield from _storytell_single_pass(text, model)
     elif text_tokens <= available_for_input:
         logger.info("Outline + per-section mode (cached prefix)...")
-        return _storytell_with_outline(text, model, no_appendix)
+        yield from _storytell_with_outline(text, model, no_appendix)
     else:
         logger.warning(
             "Text exceeds context (%d > %d tokens), condensing first...",
             text_tokens, available_for_input,
         )
-        return _storytell_chunked(text, segments, model, no_appendix)
+        yield from _storytell_chunked(text, segments, model, no_appendix)
 
 
 # ---------------------------------------------------------------------------
 # Strategy 1: Outline + per-section generation with cached prefix (default)
 # ---------------------------------------------------------------------------
 
-def _storytell_with_outline(text: str, model: str, no_appendix: bool = False) -> str:
+def _storytell_with_outline(text: str, model: str, no_appendix: bool = False) -> Iterator[str]:
     """
     Generate article using outline + per-section approach with prompt caching.
 
@@ -97,12 +131,14 @@ def _storytell_with_outline(text: str, model: str, no_appendix: bool = False) ->
     )
     if not outline_response:
         logger.warning("Outline generation failed, falling back to single-pass")
-        return _storytell_single_pass(text, model)
+        yield from _storytell_single_pass(text, model)
+        return
 
     outline = _extract_json(outline_response)
     if not outline or not outline.get('sections'):
         logger.warning("Could not parse outline, falling back to single-pass")
-        return _storytell_single_pass(text, model)
+        yield from _storytell_single_pass(text, model)
+        return
 
     chapter_title = outline.get('chapter_title', 'Глава')
     sections = outline.get('sections', [])
@@ -118,11 +154,11 @@ def _storytell_with_outline(text: str, model: str, no_appendix: bool = False) ->
     logger.info("Cached prefix: %d tokens (cached after first section call)", prefix_tokens)
 
     # Step 2: Generate each section (prefix cached from 2nd call onward)
-    section_task_template = load_prompt_template(
+    section_task_template = compile_template(load_prompt_template(
         get_config_path("storytell-section-task.txt")
-    )
+    ))
 
-    parts = [f"# {chapter_title}\n"]
+    yield f"# {chapter_title}\n"
 
     for i, section in enumerate(sections):
         section_id = section.get('id', f'S{i+1}')
@@ -149,7 +185,7 @@ def _storytell_with_outline(text: str, model: str, no_appendix: bool = False) ->
 
         logger.info("Step 2: Section %d/%d: %s...", i + 1, len(sections), section_title)
 
-        task_suffix = section_task_template.format(
+        task_suffix = section_task_template(
             section_number=i + 1,
             total_sections=len(sections),
             section_title=section_title,
@@ -161,7 +197,7 @@ def _storytell_with_outline(text: str, model: str, no_appendix: bool = False) ->
         prompt = cached_prefix + task_suffix
         section_text = _get_completion_safe(prompt, model)
         if section_text:
-            parts.append(f"\n## {section_title}\n\n{section_text}")
+            yield f"\n\n## {section_title}\n\n{section_text}"
             logger.info("  %s done: %d chars", section_id, len(section_text))
         else:
             logger.error("  %s failed, skipping", section_id)
@@ -175,11 +211,9 @@ def _storytell_with_outline(text: str, model: str, no_appendix: bool = False) ->
         prompt = cached_prefix + appendix_task
         appendix = _get_completion_safe(prompt, model)
         if appendix and appendix.strip():
-            parts.append(f"\n\n---\n\n{appendix.strip()}")
+            yield f"\n\n\n---\n\n{appendix.strip()}"
             logger.info("  Appendix done: %d chars", len(appendix))
 
-    return "\n".join(parts)
-
 
 def _build_cached_prefix(text: str, sections: list, terms: list) -> str:
     """
@@ -228,8 +262,8 @@ def _format_terms_for_prompt(terms: list) -> str:
 # Strategy 2: Single-pass (--single-pass flag)
 # ---------------------------------------------------------------------------
 
-def _storytell_single_pass(text: str, model: str) -> str:
-    """Generate article from full transcript in single LLM call.
+def _storytell_single_pass(text: str, model: str) -> Iterator[str]:
+    """Generate article from full transcript in single streamed LLM call.
 
     Raises:
         LLMError: If LLM generation fails
@@ -238,26 +272,32 @@ def _storytell_single_pass(text: str, model: str) -> str:
         get_config_path("storytell-prompt.txt")
     )
     prompt = prompt_template.format(text=text)
-    return get_completion(prompt, model, max_tokens=get_output_limit(model))
+    yield from stream_completion(prompt, model, max_tokens=get_output_limit(model))
 
 
 # ---------------------------------------------------------------------------
 # Strategy 3: Condense + outline + sections (very long transcripts)
 # ---------------------------------------------------------------------------
 
-def _storytell_chunked(text: str, segments, model: str, no_appendix: bool = False) -> str:
+def _storytell_chunked(text: str, segments, model: str, no_appendix: bool = False) -> Iterator[str]:
     """
     Generate article from text that exceeds single-pass context limit.
 
     1. Split into time-based chunks (diarized) or size-based chunks (flat)
-    2. Condense each chunk into structured notes
-    3. Generate outline from condensed notes
-    4. Write sections from condensed notes with outline context
+    2. Condense each chunk into structured notes (in parallel)
+    3. If notes still exceed context, merge adjacent notes pairwise until they fit
+    4. Generate outline from condensed notes
+    5. Write sections from condensed notes with outline context
     """
     from webinar_processor.utils.transcript_formatter import (
         format_diarized_transcript, split_segments_by_time,
     )
 
+    # Static instructions go in the system message so the prefix is shared
+    # by every chunk; only the chunk itself varies in the user message
+    condense_system = load_prompt_template(
+        get_config_path("storytell-condense-system.txt")
+    )
     condense_prompt = load_prompt_template(
         get_config_path("storytell-condense-prompt.txt")
     )
@@ -273,35 +313,51 @@ def _storytell_chunked(text: str, segments, model: str, no_appendix: bool = Fals
         text_chunks = _chunk_text_by_size(text, model)
         logger.info("Split into %d chunks", len(text_chunks))
 
-    # Pass 1: Condense each chunk
-    all_notes = []
-    total = len(text_chunks)
-    for i, chunk in enumerate(text_chunks):
-        logger.info("Condensing chunk %d/%d (%d chars)...", i + 1, total, len(chunk))
-        prompt = condense_prompt.format(
-            text=chunk, chunk_index=i + 1, total_chunks=total
-        )
-        notes = _get_completion_safe(prompt, model)
-        if notes:
-            all_notes.append(f"=== Часть {i+1} из {total} ===\n{notes}")
+    # Pass 1 (map): condense each chunk independently, in parallel
+    logger.info("Condensing %d chunks...", len(text_chunks))
+    results = _condense_chunks(text_chunks, model, condense_prompt, condense_system)
+    notes = [n for n in results if n]
 
-    if not all_notes:
+    if not notes:
         logger.error("All chunks failed to condense")
-        return None
-
-    # Pass 2: Generate outline + sections from condensed notes
-    combined_notes = '\n\n'.join(all_notes)
-    logger.info("Condensed to %d chars, generating article...", len(combined_notes))
+        return
 
-    # Check if condensed notes fit in context for outline+sections approach
-    notes_tokens = count_tokens(model, combined_notes)
     token_limit = TOKEN_LIMITS.get(model, 128000)
     output_limit = get_output_limit(model)
     available = token_limit - output_limit - 3000
 
+    combined_notes = _join_notes(notes)
+    notes_tokens = count_tokens(model, combined_notes)
+
+    # Pass 2 (reduce): merge adjacent notes pairwise, in parallel, until they
+    # fit or a round merges nothing; each round at most halves the parts
+    while notes_tokens > available and len(notes) > 1:
+        logger.info(
+            "Condensed notes too long (%d tokens), merging %d parts pairwise...",
+            notes_tokens, len(notes),
+        )
+        groups = [notes[i:i + 2] for i in range(0, len(notes), 2)]
+        pairs = [_join_notes(g) for g in groups if len(g) == 2]
+        merged = iter(_condense_chunks(pairs, model, condense_prompt, condense_system))
+        reduced = []
+        for g in groups:
+            note = next(merged) if len(g) == 2 else None
+            # A failed merge keeps both parts as they were (re-sending their
+            # concatenation would only grow); an odd trailing part passes through
+            reduced.extend([note] if note else g)
+        if len(reduced) == len(notes):
+            logger.warning("No condensed notes could be merged, stopping reduction")
+            break
+        notes = reduced
+        combined_notes = _join_notes(notes)
+        notes_tokens = count_tokens(model, combined_notes)
+
+    # Pass 3: Generate outline + sections from condensed notes
+    logger.info("Condensed to %d chars, generating article...", len(combined_notes))
+
     if notes_tokens <= available:
         # Notes fit -- use outline + sections with notes as "transcript"
-        return _storytell_with_outline(combined_notes, model, no_appendix)
+        yield from _storytell_with_outline(combined_notes, model, no_appendix)
     else:
         # Notes still too long -- fall back to single-pass from notes
         logger.warning("Condensed notes still exceed context, using single-pass from notes")
@@ -309,35 +365,96 @@ def _storytell_chunked(text: str, segments, model: str, no_appendix: bool = Fals
             get_config_path("storytell-from-notes-prompt.txt")
         )
         prompt = write_prompt.format(notes=combined_notes)
-        return get_completion(prompt, model, max_tokens=output_limit)
+        yield from stream_completion(prompt, model, max_tokens=output_limit)
+
+
+def _condense_chunks(chunks: list, model: str, prompt_template: str, system: str) -> list:
+    """Condense chunks concurrently; failed chunks come back as None, in order."""
+    total = len(chunks)
+    render = compile_template(prompt_template)
+    prompts = [
+        render(text=chunk, chunk_index=i + 1, total_chunks=total)
+        for i, chunk in enumerate(chunks)
+    ]
+    return run_concurrently(
+        lambda prompt: _get_completion_safe(prompt, model, system=system), prompts
+    )
 
 
-def _chunk_text_by_size(text: str, model: str, target_chunk_tokens: int = 50000) -> list:
-    """Split flat text into overlapping chunks for condensation."""
-    chunk_chars = int(target_chunk_tokens * 3.5)
-    overlap_chars = 5000
+def _join_notes(notes: list) -> str:
+    """Join condensed notes with numbered part headers."""
+    total = len(notes)
+    return '\n\n'.join(
+        f"=== Часть {i+1} из {total} ===\n{n}" for i, n in enumerate(notes)
+    )
+
 
-    if len(text) <= chunk_chars:
+def _chunk_text_by_size(
+    text: str,
+    model: str,
+    target_chunk_tokens: int = 50000,
+    overlap_tokens: int = 1500,
+) -> list:
+    """Split flat text into overlapping chunks for condensation.
+
+    Sentences are tokenized in a single batch and packed greedily up to
+    target_chunk_tokens; each chunk repeats roughly overlap_tokens of
+    trailing sentences from the previous one. A sentence longer than
+    target_chunk_tokens is first split between words.
+    """
+    units = _SENTENCE_BOUNDARY.split(text)
+    counts = count_tokens_batch(model, units)
+    if max(counts, default=0) > target_chunk_tokens:
+        # Unpunctuated text can leave a single sentence longer than a whole
+        # chunk; split such sentences on whitespace so every chunk fits
+        units = [
+            piece
+            for unit, count in zip(units, counts)
+            for piece in (
+                _split_on_whitespace(unit, model, target_chunk_tokens)
+                if count > target_chunk_tokens else [unit]
+            )
+        ]
+        counts = count_tokens_batch(model, units)
+
+    # prefix[i] = tokens in units[:i]; chunk/overlap boundaries become
+    # binary searches instead of per-sentence Python accumulation
+    prefix = np.concatenate(([0], np.cumsum(counts)))
+    if prefix[-1] <= target_chunk_tokens:
         return [text]
 
+    n = len(units)
     chunks = []
     start = 0
-    while start < len(text):
-        end = min(start + chunk_chars, len(text))
-        if end < len(text):
-            boundary = text.rfind('\n\n', start + chunk_chars - 10000, end)
-            if boundary == -1:
-                boundary = text.rfind('. ', start + chunk_chars - 10000, end)
-            if boundary != -1:
-                end = boundary + 2
-        chunks.append(text[start:end])
-        if end >= len(text):
+    while start < n:
+        # Furthest end with units[start:end] within budget (at least one unit)
+        end = int(np.searchsorted(prefix, prefix[start] + target_chunk_tokens, side='right')) - 1
+        end = max(end, start + 1)
+        chunks.append(''.join(units[start:end]).strip())
+        if end >= n:
             break
-        start = end - overlap_chars
+
+        # Earliest start (past the previous one) keeping overlap within budget
+        back = int(np.searchsorted(prefix, prefix[end] - overlap_tokens, side='left'))
+        start = max(back, start + 1)
 
     return chunks
 
 
+def _split_on_whitespace(text: str, model: str, max_tokens: int) -> list:
+    """Split text between words into pieces of at most max_tokens each."""
+    words = _WORD_BOUNDARY.split(text)
+    prefix = np.concatenate(([0], np.cumsum(count_tokens_batch(model, words))))
+    pieces = []
+    start = 0
+    while start < len(words):
+        end = int(np.searchsorted(prefix, prefix[start] + max_tokens, side='right')) - 1
+        end = max(end, start + 1)
+        pieces.append(''.join(words[start:end]))
+        start = end
+    return pieces
+
+
 # ---------------------------------------------------------------------------
 # Shared helpers
 # ---------------------------------------------------------------------------
@@ -356,10 +473,10 @@ def _extract_json(text: str):
     return None
 
 
-def _get_completion_safe(prompt: str, model: str) -> Optional[str]:
+def _get_completion_safe(prompt: str, model: str, system: Optional[str] = None) -> Optional[str]:
     """Get LLM completion, returning None on error instead of raising."""
     try:
-        return get_completion(prompt, model, max_tokens=get_output_limit(model))
+        return get_completion(prompt, model, max_tokens=get_output_limit(model), system=system)
     except LLMError as e:
         logger.error("LLM error: %s", e)
         return None
@@ -3,15 +3,13 @@
 import copy
 import json
 import logging
-import os
 import re
-import tempfile
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
 from webinar_processor.services.retranscription_service import RetranscriptionService
 from webinar_processor.utils.completion import get_completion
-from webinar_processor.utils.ffmpeg import extract_audio_slice
+from webinar_processor.utils.ffmpeg import load_audio
 from webinar_processor.utils.package import get_config_path
 
 logger = logging.getLogger(__name__)
@@ -294,57 +292,51 @@ def fix_transcript(
                 ))
             continue
 
-        # Extract audio slice
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            wav_path = tmp.name
-
-        try:
-            extract_audio_slice(media_path, wav_path, window.start_time, duration)
-
-            # Retranscribe (Qwen3 first — fail fast if model not available)
-            logger.info("Retranscribing window %.1f-%.1f...", window.start_time, end_time)
-            qwen3_text = retranscription.transcribe_qwen3(wav_path)
-            whisper_text = retranscription.transcribe_whisper(wav_path)
-
-            # Judge each issue in this window
-            for issue in window.issues:
-                original_text = _get_segment_text(segments, issue.segment_indices)
-                context_left = _get_context_text(segments, issue.left_valid_index, "left")
-                context_right = _get_context_text(segments, issue.right_valid_index, "right")
-
-                try:
-                    verdict = _judge_and_reconstruct(
+        # Decode just this window straight into memory; both ASR models
+        # share the waveform instead of re-reading a temp WAV
+        audio = load_audio(media_path, start=window.start_time, duration=duration)
+
+        # Retranscribe (Qwen3 first — fail fast if model not available)
+        logger.info("Retranscribing window %.1f-%.1f...", window.start_time, end_time)
+        qwen3_text = retranscription.transcribe_qwen3(audio)
+        whisper_text = retranscription.transcribe_whisper(audio)
+
+        # Judge each issue in this window
+        for issue in window.issues:
+            original_text = _get_segment_text(segments, issue.segment_indices)
+            context_left = _get_context_text(segments, issue.left_valid_index, "left")
+            context_right = _get_context_text(segments, issue.right_valid_index, "right")
+
+            try:
+                verdict = _judge_and_reconstruct(
+                    original_text=original_text,
+                    context_left=context_left,
+                    context_right=context_right,
+                    whisper_text=whisper_text,
+                    qwen3_text=qwen3_text,
+                    model=model,
+                    prompt_template=prompt_template,
+                )
+
+                if verdict.get("has_problem"):
+                    results.append(FixResult(
+                        issue_id=issue.issue_id,
+                        outcome="fixed",
+                        original_text=original_text,
+                        corrected_text=verdict.get("corrected_text", ""),
+                        source=verdict.get("source", ""),
+                        reasoning=verdict.get("reasoning", ""),
+                    ))
+                else:
+                    results.append(FixResult(
+                        issue_id=issue.issue_id,
+                        outcome="kept_original",
                         original_text=original_text,
-                        context_left=context_left,
-                        context_right=context_right,
-                        whisper_text=whisper_text,
-                        qwen3_text=qwen3_text,
-                        model=model,
-                        prompt_template=prompt_template,
-                    )
-
-                    if verdict.get("has_problem"):
-                        results.append(FixResult(
-                            issue_id=issue.issue_id,
-                            outcome="fixed",
-                            original_text=original_text,
-                            corrected_text=verdict.get("corrected_text", ""),
-                            source=verdict.get("source", ""),
-                            reasoning=verdict.get("reasoning", ""),
-                        ))
-                    else:
-                        results.append(FixResult(
-                            issue_id=issue.issue_id,
-                            outcome="kept_original",
-                            original_text=original_text,
-                            reasoning=verdict.get("reasoning", ""),
-                        ))
-                except Exception as e:
-                    logger.error("LLM judge failed for %s: %s", issue.issue_id, e)
-                    raise
-        finally:
-            if os.path.exists(wav_path):
-                os.unlink(wav_path)
+                        reasoning=verdict.get("reasoning", ""),
+                    ))
+            except Exception as e:
+                logger.error("LLM judge failed for %s: %s", issue.issue_id, e)
+                raise
 
     fixed_segments = apply_fixes(segments, results, issue_map)
     fix_report = _generate_fix_report(
@@ -4,10 +4,10 @@ Used by summarize, storytell, and quiz commands to avoid
 duplicating the load-JSON / detect-format / format pattern.
 """
 
-import json
 import logging
 from typing import Optional, Tuple
 
+from webinar_processor.utils.io import load_json
 from webinar_processor.utils.transcript_formatter import (
     is_diarized_format,
     format_diarized_transcript,
@@ -39,8 +39,7 @@ def load_and_format_transcript(
         json.JSONDecodeError: If file is not valid JSON
         ValueError: If transcript contains no processable text
     """
-    with open(asr_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_json(asr_file)
 
     if is_diarized_format(data):
         logger.info("Diarized transcript detected, formatting...")
@@ -8,7 +8,8 @@ from dataclasses import dataclass, asdict
 from datetime import date
 from typing import Dict, List, Optional
 
-from webinar_processor.utils.completion import get_completion
+from webinar_processor.utils.completion import get_completion, run_concurrently
+from webinar_processor.utils.io import compile_template
 from webinar_processor.utils.package import get_config_path
 
 logger = logging.getLogger(__name__)
@@ -64,6 +65,9 @@ def validate_transcript(segments: list) -> None:
 
 # --- Heuristics ---
 
+_WHITESPACE_RE = re.compile(r'[ \t\n]')
+
+
 def _check_repetition_loop(seg_index: int, segments: list) -> Optional[Dict]:
     """H1: Detect repeating phrase patterns."""
     seg = segments[seg_index]
@@ -109,17 +113,14 @@ def _check_long_text_no_sentence_markers(seg_index: int, segments: list) -> Opti
     if len(text) <= 200:
         return None
 
-    sentence_ends = sum(1 for c in text if c in ".!?")
+    sentence_ends = text.count(".") + text.count("!") + text.count("?")
     punct_ratio = sentence_ends / len(text) if text else 0
 
-    # Count uppercase after whitespace (sentence starts)
-    upper_after_ws = 0
-    ws_count = 0
-    for i, c in enumerate(text):
-        if c in " \t\n":
-            ws_count += 1
-            if i + 1 < len(text) and text[i + 1].isupper():
-                upper_after_ws += 1
+    # Count uppercase after whitespace (sentence starts): every piece after
+    # a split point follows one whitespace char
+    pieces = _WHITESPACE_RE.split(text)
+    ws_count = len(pieces) - 1
+    upper_after_ws = sum(1 for piece in pieces[1:] if piece[:1].isupper())
     cap_ratio = upper_after_ws / max(ws_count, 1)
 
     # Thresholds: normal text has ~2-4% sentence-end punctuation and ~5-15% capitalization after ws
@@ -136,8 +137,9 @@ def _check_long_text_no_sentence_markers(seg_index: int, segments: list) -> Opti
     return None
 
 
-_ALLOWED_CHARS_RE = re.compile(
-    r'[а-яА-ЯёЁa-zA-Z0-9\s'
+# Any single character outside the expected alphabet
+_UNEXPECTED_CHAR_RE = re.compile(
+    r'[^а-яА-ЯёЁa-zA-Z0-9\s'
     r'.,!?;:\-—–()\[\]"\'«»…%]'
 )
 
@@ -148,7 +150,7 @@ def _check_out_of_alphabet(seg_index: int, segments: list) -> Optional[Dict]:
     if not text:
         return None
 
-    unexpected = [c for c in text if not _ALLOWED_CHARS_RE.match(c)]
+    unexpected = _UNEXPECTED_CHAR_RE.findall(text)
     ratio = len(unexpected) / len(text)
 
     if ratio > 0.05:
@@ -225,46 +227,111 @@ def _get_context(segments: list, seg_idx: int, direction: str, count: int = 3) -
     return "\n".join(lines)
 
 
-def run_llm_verification(segments: list, candidates: List[TranscriptIssue], model: str) -> List[TranscriptIssue]:
-    prompt_template = _load_verify_prompt()
+def _issue_prompt_fields(segments: list, issue: TranscriptIssue) -> Dict[str, str]:
+    seg_idx = issue.segment_indices[0]
+    return {
+        "context_left": _get_context(segments, seg_idx, "left") or "(начало транскрипта)",
+        "flagged_text": segments[seg_idx]["text"].strip(),
+        "context_right": _get_context(segments, seg_idx, "right") or "(конец транскрипта)",
+        "rule_id": issue.rule_id,
+        "evidence": json.dumps(issue.evidence, ensure_ascii=False),
+    }
 
-    for issue in candidates:
-        seg_idx = issue.segment_indices[0]
-        flagged_text = segments[seg_idx]["text"].strip()
-        context_left = _get_context(segments, seg_idx, "left")
-        context_right = _get_context(segments, seg_idx, "right")
-
-        prompt = prompt_template.format(
-            context_left=context_left or "(начало транскрипта)",
-            flagged_text=flagged_text,
-            context_right=context_right or "(конец транскрипта)",
-            rule_id=issue.rule_id,
-            evidence=json.dumps(issue.evidence, ensure_ascii=False),
+
+def _parse_verdict(verdict_data: Dict) -> LLMVerdict:
+    return LLMVerdict(
+        decision=verdict_data.get("decision", "no_problem"),
+        confidence=float(verdict_data.get("confidence", 0.0)),
+        reason=verdict_data.get("reason", ""),
+    )
+
+
+def _log_verdict(issue: TranscriptIssue) -> None:
+    logger.info("LLM verdict for %s: %s (%.2f)",
+                issue.issue_id, issue.llm_verdict.decision, issue.llm_verdict.confidence)
+
+
+def _verify_single(segments: list, issue: TranscriptIssue, render_prompt, model: str) -> None:
+    prompt = render_prompt(**_issue_prompt_fields(segments, issue))
+
+    try:
+        response = get_completion(prompt, model=model)
+        issue.llm_verdict = _parse_verdict(json.loads(response.strip()))
+        _log_verdict(issue)
+    except (json.JSONDecodeError, KeyError, ValueError) as e:
+        logger.warning("Failed to parse LLM verdict for %s: %s", issue.issue_id, e)
+        issue.llm_verdict = LLMVerdict(
+            decision="problem",
+            confidence=0.0,
+            reason=f"LLM response parse error: {e}",
         )
 
-        try:
-            response = get_completion(prompt, model=model)
-            verdict_data = json.loads(response.strip())
-            issue.llm_verdict = LLMVerdict(
-                decision=verdict_data.get("decision", "no_problem"),
-                confidence=float(verdict_data.get("confidence", 0.0)),
-                reason=verdict_data.get("reason", ""),
-            )
-            logger.info("LLM verdict for %s: %s (%.2f)",
-                        issue.issue_id, issue.llm_verdict.decision, issue.llm_verdict.confidence)
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
-            logger.warning("Failed to parse LLM verdict for %s: %s", issue.issue_id, e)
-            issue.llm_verdict = LLMVerdict(
-                decision="problem",
-                confidence=0.0,
-                reason=f"LLM response parse error: {e}",
-            )
+
+def _verify_batch(segments: list, batch: List[TranscriptIssue], batch_template: str, model: str) -> bool:
+    """Judge several issues in one request. Returns False if the reply can't be matched up."""
+    items = []
+    for n, issue in enumerate(batch, 1):
+        fields = _issue_prompt_fields(segments, issue)
+        items.append(
+            f"### ФРАГМЕНТ {n}\n"
+            f"Контекст слева (предыдущие сегменты):\n{fields['context_left']}\n\n"
+            f">>> ПРОВЕРЯЕМЫЙ ФРАГМЕНТ <<<\n{fields['flagged_text']}\n\n"
+            f"Контекст справа (следующие сегменты):\n{fields['context_right']}\n\n"
+            f"Эвристическое правило, которое сработало: {fields['rule_id']}\n"
+            f"Обнаруженные признаки: {fields['evidence']}"
+        )
+    prompt = batch_template.format(count=len(batch), items="\n\n".join(items))
+
+    response = get_completion(prompt, model=model)
+    try:
+        verdicts = json.loads(response.strip())
+        if not isinstance(verdicts, list) or len(verdicts) != len(batch):
+            raise ValueError(f"expected a list of {len(batch)} verdicts")
+        parsed = [_parse_verdict(v) for v in verdicts]
+    except (json.JSONDecodeError, KeyError, ValueError, TypeError, AttributeError) as e:
+        logger.warning("Failed to parse batched LLM verdicts for %s: %s",
+                       ", ".join(i.issue_id for i in batch), e)
+        return False
+
+    for issue, verdict in zip(batch, parsed):
+        issue.llm_verdict = verdict
+        _log_verdict(issue)
+    return True
+
+
+def run_llm_verification(
+    segments: list,
+    candidates: List[TranscriptIssue],
+    model: str,
+    batch_size: int = 4,
+) -> List[TranscriptIssue]:
+    """Attach an LLM verdict to each candidate.
+
+    Candidates are judged batch_size at a time in a single request that
+    returns a JSON array; a batch whose reply can't be parsed is retried
+    one issue per request. Requests are independent, so each round is sent
+    concurrently (LLM_MAX_CONCURRENCY).
+    """
+    render_prompt = compile_template(_load_verify_prompt())
+    batch_template = _load_verify_prompt("transcript-verify-judge-batch-prompt.txt")
+
+    size = max(1, batch_size)
+    batches = [candidates[start:start + size] for start in range(0, len(candidates), size)]
+    multi = [batch for batch in batches if len(batch) > 1]
+
+    batched_ok = run_concurrently(
+        lambda batch: _verify_batch(segments, batch, batch_template, model), multi
+    )
+    single = [issue for batch, ok in zip(multi, batched_ok) if not ok for issue in batch]
+    single += [batch[0] for batch in batches if len(batch) == 1]
+
+    run_concurrently(lambda issue: _verify_single(segments, issue, render_prompt, model), single)
 
     return candidates
 
 
-def _load_verify_prompt() -> str:
-    path = get_config_path("transcript-verify-judge-prompt.txt")
+def _load_verify_prompt(name: str = "transcript-verify-judge-prompt.txt") -> str:
+    path = get_config_path(name)
     with open(path, "r", encoding="utf-8") as f:
         return f.read()
 
@@ -3,34 +3,113 @@
 This module owns heavy ASR/diarization logic so CLI commands stay thin.
 """
 
+import bisect
+import importlib.util
+import itertools
 import logging
 import os
-from typing import Any, Dict, List, Optional, Union
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
+from webinar_processor.utils.cache import audio_cache_key
+
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
 DEFAULT_ASR_MODEL = "large-v3"
+DEFAULT_ASR_BACKEND = "whisper"
+DEFAULT_BEAM_SIZE = 1
+DEFAULT_ASR_GPU_BATCH_SIZE = 8
+AUDIO_SAMPLE_RATE = 16000
 DEFAULT_DIARIZATION_MODEL = "pyannote/speaker-diarization-3.1"
+DEFAULT_DIARIZATION_GPU_BATCH_SIZE = 32
+# Free VRAM (after both models are loaded) needed to run ASR and
+# diarization side by side
+OVERLAP_MIN_FREE_VRAM = 4 * 1024**3
+WHISPER_DECODE_DEFAULTS = {
+    "condition_on_previous_text": False,
+    "temperature": (0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+    "compression_ratio_threshold": 2.4,
+    "no_speech_threshold": 0.6,
+}
+# Part of every transcript cache key; bump when a change to decoding or
+# merging code alters output without changing any setting below
+TRANSCRIPT_CACHE_VERSION = 2
 ASR_LANGUAGE_MAP = {
     "ru": "russian",
     "en": "english",
 }
 
 
-def transcribe_wav(wav_filename: str, language: str = "ru") -> Dict[str, Any]:
-    """Transcribe WAV audio into Whisper-compatible segment structure."""
-    import whisper
+def preload_models(asr: bool = True, hf_token: Optional[str] = None) -> Future:
+    """Start loading the ASR model and diarization pipeline on a background thread.
+
+    Lets model loading overlap with ffmpeg work. Wait on the returned future
+    before transcribing so a model isn't loaded twice. Load failures are only
+    logged; the real call will raise them.
+    """
+    future: Future = Future()
+
+    def run():
+        _preload_models(asr, hf_token)
+        future.set_result(None)
+
+    # Daemon thread: a caller that fails before using the models doesn't
+    # have to wait for loading at exit
+    threading.Thread(target=run, name="model-preload", daemon=True).start()
+    return future
+
+
+def _preload_models(asr: bool, hf_token: Optional[str]) -> None:
+    if asr:
+        model_id = os.getenv("ASR_WHISPER_MODEL", DEFAULT_ASR_MODEL)
+        try:
+            if _asr_backend() == "faster-whisper":
+                _load_faster_whisper_model(model_id, _default_compute_type())
+            else:
+                _load_whisper_model(model_id, _whisper_int8())
+        except Exception as e:
+            logger.warning("ASR model preload failed: %s", e)
 
+    token = hf_token or os.getenv("HUGGING_FACE_TOKEN")
+    if token:
+        try:
+            _load_diarization_pipeline(DEFAULT_DIARIZATION_MODEL, token)
+        except Exception as e:
+            logger.warning("Diarization pipeline preload failed: %s", e)
+
+
+def transcribe_wav(audio: Union[str, "np.ndarray"], language: str = "ru") -> Dict[str, Any]:
+    """Transcribe audio into Whisper-compatible segment structure.
+
+    audio is a WAV path or a 16 kHz mono float32 waveform (see
+    utils.ffmpeg.load_audio); both backends accept either.
+
+    The ASR_BACKEND env var selects openai-whisper ("whisper", the default)
+    or CTranslate2-based faster-whisper ("faster-whisper"); "auto" opts in
+    to faster-whisper whenever it is installed. Both return the same dict
+    shape so diarization is unaffected.
+    """
     model_id = os.getenv("ASR_WHISPER_MODEL", DEFAULT_ASR_MODEL)
+    backend = _asr_backend()
     normalized_language = _normalize_asr_language(language)
 
-    logger.info("Loading Whisper model: %s", model_id)
-    model = whisper.load_model(model_id)
-
-    logger.info("Transcribing audio: %s", wav_filename)
-    result = model.transcribe(wav_filename, language=normalized_language)
+    if backend == "faster-whisper":
+        result = _transcribe_faster_whisper(audio, model_id, language)
+    elif backend == "whisper":
+        model = _load_whisper_model(model_id, _whisper_int8())
+        logger.info("Transcribing audio: %s", _describe_audio(audio))
+        result = model.transcribe(
+            audio, language=normalized_language, **whisper_decode_options(model)
+        )
+    else:
+        raise ValueError(f"Unknown ASR_BACKEND: {backend}")
 
     formatted_result = {
         "text": result.get("text", ""),
@@ -46,28 +125,193 @@ def transcribe_wav(wav_filename: str, language: str = "ru") -> Dict[str, Any]:
     return formatted_result
 
 
+def whisper_decode_options(model) -> Dict[str, Any]:
+    """openai-whisper transcribe() options shared by every caller.
+
+    Not conditioning on the previous window stops one hallucinated segment
+    from seeding a repetition loop that burns the whole 448-token budget;
+    the temperature fallback plus thresholds retries only windows that
+    actually look degenerate. fp16 only on GPU (on CPU whisper warns and
+    falls back to fp32 anyway).
+    """
+    return {"fp16": model.device.type == "cuda", **WHISPER_DECODE_DEFAULTS}
+
+
+def _transcribe_faster_whisper(audio: Union[str, "np.ndarray"], model_id: str, language: str) -> Dict[str, Any]:
+    """Transcribe with faster-whisper and convert to openai-whisper's result shape."""
+    model = _load_faster_whisper_model(model_id, _default_compute_type())
+
+    logger.info("Transcribing audio: %s", _describe_audio(audio))
+    vad_filter = _vad_enabled()
+    options = {
+        "language": _asr_language_code(language),
+        "beam_size": int(os.getenv("ASR_BEAM_SIZE", DEFAULT_BEAM_SIZE)),
+        "vad_filter": vad_filter,
+        "vad_parameters": {"min_silence_duration_ms": 500} if vad_filter else None,
+        "condition_on_previous_text": False,
+    }
+    # Batching needs the VAD speech chunks; without VAD decode sequentially
+    batch_size = _asr_batch_size() if vad_filter else 1
+    if batch_size > 1:
+        from faster_whisper import BatchedInferencePipeline
+
+        # Decode up to batch_size speech chunks per step instead of one
+        # 30 s window after another; each step's single-token decoder
+        # matmuls are otherwise far too small to fill the GPU
+        logger.info("Batched ASR: %d chunks per step", batch_size)
+        # The batched pipeline defaults to one segment per chunk (up to 30 s);
+        # keep timestamp tokens so segments split at speaker-sized
+        # boundaries and diarization can assign them speakers
+        segments_iter, _info = BatchedInferencePipeline(model=model).transcribe(
+            audio, batch_size=batch_size, without_timestamps=False, **options
+        )
+    else:
+        segments_iter, _info = model.transcribe(audio, **options)
+
+    # The segment generator decodes lazily; materializing it runs the ASR
+    segments = [
+        {
+            "id": seg.id,
+            "seek": seg.seek,
+            "start": seg.start,
+            "end": seg.end,
+            "text": seg.text,
+            "tokens": list(seg.tokens),
+            "temperature": seg.temperature,
+            "avg_logprob": seg.avg_logprob,
+            "compression_ratio": seg.compression_ratio,
+            "no_speech_prob": seg.no_speech_prob,
+        }
+        for seg in segments_iter
+    ]
+    return {
+        "text": "".join(seg["text"] for seg in segments),
+        "segments": segments,
+    }
+
+
 def diarize_wav(
-    wav_filename: str,
+    audio: Union[str, "np.ndarray"],
     transcription_result: Dict[str, Any],
     hf_token: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
-    """Run speaker diarization and merge it with ASR segments."""
-    from pyannote.audio import Pipeline
-    from pyannote_whisper.utils import diarize_text
+    """Run speaker diarization and merge it with ASR segments.
 
+    audio is a WAV path or a 16 kHz mono float32 waveform.
+    """
+    token = _require_hf_token(hf_token)
+    diarization = _run_diarization(audio, token)
+    return _merge_diarization(transcription_result, diarization)
+
+
+def transcribe_and_diarize(
+    audio: Union[str, "np.ndarray"],
+    language: str = "ru",
+    hf_token: Optional[str] = None,
+    on_asr: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Transcribe and diarize the same audio; return (asr_result, diarized segments).
+
+    The two models are independent until the final merge. On a GPU with
+    enough free memory, diarization runs on its own CUDA stream alongside
+    ASR so its dense kernels fill the gaps in Whisper's autoregressive
+    decoding. Otherwise the steps run one after the other.
+
+    on_asr, if given, is called with the ASR result as soon as ASR finishes,
+    before waiting for diarization, so callers can persist it even if
+    diarization later fails.
+    """
+    token = _require_hf_token(hf_token)
+    if not _can_overlap_on_gpu():
+        asr_result = transcribe_wav(audio, language=language)
+        if on_asr:
+            on_asr(asr_result)
+        return asr_result, _merge_diarization(asr_result, _run_diarization(audio, token))
+
+    logger.info("Running ASR and diarization concurrently")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        diarization_future = executor.submit(_run_diarization_on_side_stream, audio, token)
+        asr_result = transcribe_wav(audio, language=language)
+        if on_asr:
+            on_asr(asr_result)
+        diarization = diarization_future.result()
+    return asr_result, _merge_diarization(asr_result, diarization)
+
+
+def transcript_cache_key(audio: "np.ndarray", language: str = "ru") -> str:
+    """Content-addressed key for transcribe_and_diarize results on this audio.
+
+    Covers the samples, language, ASR model, backend and its decoding
+    settings (ASR_* env vars and openai-whisper decode defaults), the
+    diarization model and DIARIZATION_BATCH_SIZE, plus
+    TRANSCRIPT_CACHE_VERSION for code changes.
+    """
+    settings = {
+        "version": TRANSCRIPT_CACHE_VERSION,
+        "language": _normalize_asr_language(language),
+        "asr_model": os.getenv("ASR_WHISPER_MODEL", DEFAULT_ASR_MODEL),
+        "diarization_model": DEFAULT_DIARIZATION_MODEL,
+        "diarization_batch_size": os.getenv("DIARIZATION_BATCH_SIZE", ""),
+        **_asr_settings(_asr_backend()),
+    }
+    return audio_cache_key(audio, *(f"{name}={value}" for name, value in sorted(settings.items())))
+
+
+def _asr_settings(backend: str) -> Dict[str, Any]:
+    """Effective settings of an ASR backend that affect its output."""
+    if backend == "faster-whisper":
+        vad_filter = _vad_enabled()
+        return {
+            "backend": backend,
+            "compute_type": _default_compute_type(),
+            "beam_size": int(os.getenv("ASR_BEAM_SIZE", DEFAULT_BEAM_SIZE)),
+            "vad_filter": vad_filter,
+            "batch_size": _asr_batch_size() if vad_filter else 1,
+        }
+    return {
+        "backend": backend,
+        # fp16 on GPU / fp32 on CPU follows the device, not a setting
+        "compute_type": "int8" if _whisper_int8() else "default",
+        **WHISPER_DECODE_DEFAULTS,
+    }
+
+
+def _require_hf_token(hf_token: Optional[str]) -> str:
     token = hf_token or os.getenv("HUGGING_FACE_TOKEN")
     if not token:
         raise ValueError("HUGGING_FACE_TOKEN is not set")
+    return token
 
-    logger.info("Loading diarization model: %s", DEFAULT_DIARIZATION_MODEL)
-    pipeline = Pipeline.from_pretrained(
-        DEFAULT_DIARIZATION_MODEL,
-        token=token,
-    )
 
-    diarization_output = pipeline(wav_filename)
-    diarization_result = diarization_output.speaker_diarization
-    diarized_segments = diarize_text(transcription_result, diarization_result)
+def _run_diarization(audio: Union[str, "np.ndarray"], token: str):
+    pipeline = _load_diarization_pipeline(DEFAULT_DIARIZATION_MODEL, token)
+    return pipeline(_pipeline_input(audio)).speaker_diarization
+
+
+def _run_diarization_on_side_stream(audio: Union[str, "np.ndarray"], token: str):
+    import torch
+
+    # The current stream is per thread, so this doesn't affect ASR's kernels
+    stream = torch.cuda.Stream()
+    with torch.cuda.stream(stream):
+        diarization = _run_diarization(audio, token)
+    stream.synchronize()
+    return diarization
+
+
+def _can_overlap_on_gpu() -> bool:
+    import torch
+
+    if not torch.cuda.is_available():
+        return False
+    free, _total = torch.cuda.mem_get_info()
+    return free >= OVERLAP_MIN_FREE_VRAM
+
+
+def _merge_diarization(transcription_result: Dict[str, Any], diarization) -> List[Dict[str, Any]]:
+    from pyannote_whisper.utils import diarize_text
+
+    diarized_segments = diarize_text(transcription_result, _SpeakerTimeline(diarization))
 
     result = []
     for seg, speaker, text in diarized_segments:
@@ -84,6 +328,225 @@ def diarize_wav(
     return result
 
 
+class _SpeakerTimeline:
+    """Indexed view of a diarization Annotation for per-segment speaker lookup.
+
+    diarize_text calls annotation.crop(segment).argmax() once per ASR
+    segment, and each pyannote crop scans the whole timeline, which is
+    O(segments x turns) for a long webinar. Turns are sorted once here so a
+    lookup only visits turns that can overlap the segment. Anything else is
+    delegated to the wrapped annotation.
+    """
+
+    def __init__(self, annotation):
+        self._annotation = annotation
+        self._turns = sorted(
+            (seg.start, seg.end, label)
+            for seg, _track, label in annotation.itertracks(yield_label=True)
+        )
+        self._starts = [start for start, _end, _label in self._turns]
+        # reach[i] = latest end among turns[:i + 1]; nondecreasing, so every
+        # turn that ends before a query start is skipped by one bisect
+        self._reach = list(itertools.accumulate((end for _start, end, _label in self._turns), max))
+
+    def crop(self, support, *args, **kwargs):
+        if args or kwargs:
+            return self._annotation.crop(support, *args, **kwargs)
+        return _CroppedSpeakers(self, support)
+
+    def speaker_at(self, start: float, end: float) -> Optional[str]:
+        """Label with the most overlap with [start, end], like crop().argmax()."""
+        lo = bisect.bisect_right(self._reach, start)
+        hi = bisect.bisect_left(self._starts, end)
+        durations: Dict[str, float] = {}
+        for turn_start, turn_end, label in self._turns[lo:hi]:
+            overlap = min(turn_end, end) - max(turn_start, start)
+            if overlap > 0:
+                durations[label] = durations.get(label, 0.0) + overlap
+        if not durations:
+            return None
+        # Ties go to the first label in sorted order, as in Annotation.argmax
+        return max(sorted(durations), key=durations.get)
+
+    def __getattr__(self, name):
+        return getattr(self._annotation, name)
+
+
+class _CroppedSpeakers:
+    """Lazy result of _SpeakerTimeline.crop; only argmax() skips the real crop."""
+
+    def __init__(self, timeline: _SpeakerTimeline, support):
+        self._timeline = timeline
+        self._support = support
+
+    def argmax(self, *args, **kwargs):
+        if args or kwargs:
+            return self._cropped().argmax(*args, **kwargs)
+        return self._timeline.speaker_at(self._support.start, self._support.end)
+
+    def _cropped(self):
+        return self._timeline._annotation.crop(self._support)
+
+    def __getattr__(self, name):
+        return getattr(self._cropped(), name)
+
+
+@lru_cache(maxsize=2)
+def _load_whisper_model(model_id: str, int8: bool = False):
+    """Load a Whisper model once per process and reuse it across calls.
+
+    With int8, a model that ends up on CPU gets INT8 Linear layers; the flag
+    is part of the cache key so quantized and full-precision models never
+    mix.
+    """
+    import whisper
+
+    logger.info("Loading Whisper model: %s", model_id)
+    model = whisper.load_model(model_id)
+    if int8 and model.device.type == "cpu":
+        model = _quantize_whisper_model(model)
+    return model
+
+
+def _whisper_int8() -> bool:
+    """Whether openai-whisper on CPU is quantized to INT8 (ASR_WHISPER_INT8, off by default)."""
+    return os.getenv("ASR_WHISPER_INT8", "0").strip().lower() in ("1", "true", "yes")
+
+
+def _quantize_whisper_model(model):
+    """Apply dynamic INT8 quantization to the Linear layers of a CPU Whisper model.
+
+    Roughly quarters the size of the Linear weights and speeds up CPU
+    decoding; convolutions and embeddings stay in FP32.
+    """
+    import torch
+
+    # whisper.model.Linear only adds a dtype cast in forward(); quantize_dynamic
+    # matches exact types, so present those layers as plain nn.Linear
+    for module in model.modules():
+        if isinstance(module, torch.nn.Linear):
+            module.__class__ = torch.nn.Linear
+
+    logger.info("Quantizing Whisper Linear layers to INT8 for CPU inference")
+    # In place: this freshly loaded model is only ever used quantized
+    return torch.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+    )
+
+
+@lru_cache(maxsize=1)
+def _load_diarization_pipeline(model_id: str, token: str):
+    """Load the pyannote pipeline once per process, on GPU when available."""
+    import torch
+    from pyannote.audio import Pipeline
+
+    logger.info("Loading diarization model: %s", model_id)
+    pipeline = Pipeline.from_pretrained(model_id, token=token)
+    # pyannote pipelines start on CPU
+    use_cuda = torch.cuda.is_available()
+    pipeline.to(torch.device("cuda" if use_cuda else "cpu"))
+
+    # Run segmentation and embedding over many sliding windows per forward
+    # pass; one window at a time leaves the GPU mostly idle
+    batch_size = os.getenv("DIARIZATION_BATCH_SIZE")
+    if batch_size or use_cuda:
+        batch_size = int(batch_size or DEFAULT_DIARIZATION_GPU_BATCH_SIZE)
+        attrs = [
+            attr for attr in ("segmentation_batch_size", "embedding_batch_size")
+            if hasattr(pipeline, attr)
+        ]
+        if not attrs:
+            logger.warning(
+                "Diarization pipeline has no segmentation/embedding batch size; "
+                "DIARIZATION_BATCH_SIZE=%d not applied", batch_size,
+            )
+        for attr in attrs:
+            setattr(pipeline, attr, batch_size)
+            # Read back: some pyannote versions expose these as properties
+            logger.info("Diarization %s: %s", attr, getattr(pipeline, attr))
+    return pipeline
+
+
+def _pipeline_input(audio: Union[str, "np.ndarray"]):
+    """Wrap an in-memory waveform in the dict form pyannote pipelines accept."""
+    if isinstance(audio, str):
+        return audio
+    import torch
+
+    return {"waveform": torch.from_numpy(audio)[None], "sample_rate": AUDIO_SAMPLE_RATE}
+
+
+def _describe_audio(audio: Union[str, "np.ndarray"]) -> str:
+    if isinstance(audio, str):
+        return audio
+    return f"<{len(audio) / AUDIO_SAMPLE_RATE:.0f}s waveform>"
+
+
+def asr_skips_silence() -> bool:
+    """Whether the configured ASR backend drops silence itself (faster-whisper VAD).
+
+    When true, callers can skip the separate ffmpeg silence-removal pass.
+    """
+    return _asr_backend() == "faster-whisper" and _vad_enabled()
+
+
+def _asr_backend() -> str:
+    backend = os.getenv("ASR_BACKEND", DEFAULT_ASR_BACKEND).strip().lower()
+    if backend == "auto":
+        return "faster-whisper" if _faster_whisper_installed() else "whisper"
+    return backend
+
+
+def _faster_whisper_installed() -> bool:
+    try:
+        return importlib.util.find_spec("faster_whisper") is not None
+    except ValueError:
+        # Already imported without a spec (e.g. replaced in sys.modules)
+        return "faster_whisper" in sys.modules
+
+
+def _vad_enabled() -> bool:
+    return os.getenv("ASR_VAD_FILTER", "1").strip().lower() not in ("0", "false", "no")
+
+
+@lru_cache(maxsize=2)
+def _load_faster_whisper_model(model_id: str, compute_type: str):
+    """Load a faster-whisper (CTranslate2) model once per process."""
+    from faster_whisper import WhisperModel
+
+    logger.info("Loading faster-whisper model: %s (%s)", model_id, compute_type)
+    return WhisperModel(model_id, device="auto", compute_type=compute_type)
+
+
+def _default_compute_type() -> str:
+    """INT8 weights everywhere; FP16 activations when a GPU is present."""
+    compute_type = os.getenv("ASR_COMPUTE_TYPE")
+    if compute_type:
+        return compute_type
+
+    import ctranslate2
+
+    return "int8_float16" if ctranslate2.get_cuda_device_count() > 0 else "int8"
+
+
+def _asr_batch_size() -> int:
+    """Speech chunks decoded per faster-whisper step (ASR_BATCH_SIZE; default 8 on GPU, 1 on CPU)."""
+    batch_size = os.getenv("ASR_BATCH_SIZE")
+    if batch_size:
+        return int(batch_size)
+
+    import ctranslate2
+
+    return DEFAULT_ASR_GPU_BATCH_SIZE if ctranslate2.get_cuda_device_count() > 0 else 1
+
+
+def _asr_language_code(language: str) -> str:
+    """Map a language name or code to the ISO code faster-whisper expects."""
+    normalized = (language or "ru").strip().lower()
+    codes = {name: code for code, name in ASR_LANGUAGE_MAP.items()}
+    return codes.get(normalized, normalized)
+
+
 def _normalize_asr_language(language: str) -> str:
     normalized = (language or "ru").strip().lower()
     return ASR_LANGUAGE_MAP.get(normalized, normalized)
@@ -1,12 +1,12 @@
 import logging
 import numpy as np
+import torch
 from typing import Dict, List, Optional
 from pyannote.audio import Audio
 from pyannote.core import Segment
 from pyannote.audio.pipelines.speaker_verification import PretrainedSpeakerEmbedding
-import tempfile
 import os
-from webinar_processor.utils.ffmpeg import convert_mp4_to_wav, get_wav_filename
+from webinar_processor.utils.ffmpeg import convert_mp4_to_wav
 
 logger = logging.getLogger(__name__)
 
@@ -16,19 +16,36 @@ class VoiceEmbeddingService:
 
     DEFAULT_MODEL = 'pyannote/wespeaker-voxceleb-resnet34-LM'
 
-    def __init__(self, model_name: str = None):
+    def __init__(self, model_name: str = None, warmup: Optional[bool] = None):
         self.model_name = model_name or os.environ.get(
             'SPEAKER_EMBEDDING_MODEL', self.DEFAULT_MODEL
         )
-        self.model = PretrainedSpeakerEmbedding(self.model_name)
+        use_cuda = torch.cuda.is_available()
+        self.model = PretrainedSpeakerEmbedding(
+            self.model_name, device=torch.device("cuda" if use_cuda else "cpu")
+        )
         self.audio = Audio(sample_rate=16000, mono="downmix")
+        if warmup is None:
+            warmup = use_cuda
+        if warmup:
+            self._warmup()
+
+    def _warmup(self) -> None:
+        """Run one dummy forward pass so CUDA context and kernel loading happen up front."""
+        try:
+            dummy = torch.zeros(1, 1, 16000 * 3, device=self.model.device)
+            with torch.inference_mode():
+                self.model(dummy)
+        except Exception as e:
+            logger.warning("Voice embedding model warmup failed: %s", e)
 
     def extract_embedding(self, audio_path: str, start_time: float, end_time: float) -> Optional[np.ndarray]:
         """Extract voice embedding from an audio segment."""
         try:
             segment = Segment(start_time, end_time)
             waveform, sample_rate = self.audio.crop(audio_path, segment)
-            embedding = self.model(waveform[None])
+            with torch.inference_mode():
+                embedding = self.model(waveform[None])
             return embedding[0]
         except Exception as e:
             logger.error("Error extracting voice embedding: %s", e)
@@ -41,7 +58,8 @@ class VoiceEmbeddingService:
         """
         try:
             waveform, sample_rate = self.audio(audio_path)
-            embedding = self.model(waveform[None])
+            with torch.inference_mode():
+                embedding = self.model(waveform[None])
             return embedding[0]
         except Exception as e:
             logger.error("Error extracting single-speaker embedding: %s", e)
@@ -94,17 +112,33 @@ class VoiceEmbeddingService:
         """
         return (stored * n_samples + new) / (n_samples + 1)
 
+    @staticmethod
+    def _sibling_wav(audio_path: str) -> str:
+        """Return a WAV next to audio_path, converting unless an up-to-date one exists."""
+        stem = os.path.splitext(audio_path)[0]
+        wav_path = stem + '.wav'
+        if os.path.exists(wav_path) and os.path.getmtime(wav_path) >= os.path.getmtime(audio_path):
+            return wav_path
+
+        # Convert under a temporary name so an interrupted or failed ffmpeg
+        # run never leaves a truncated WAV for later runs to reuse
+        part_path = stem + '.part.wav'
+        try:
+            convert_mp4_to_wav(audio_path, part_path)
+            os.replace(part_path, wav_path)
+        except BaseException:
+            if os.path.exists(part_path):
+                os.unlink(part_path)
+            raise
+        return wav_path
+
     def process_audio_file(self,
                            audio_path: str,
                            transcript: List[Dict],
                            min_duration: float = 3.0) -> Dict[str, np.ndarray]:
         """Process an audio file and get mean embeddings for each speaker."""
-        # Convert to WAV if needed
         if not audio_path.lower().endswith('.wav'):
-            with tempfile.TemporaryDirectory() as tmpdir:
-                wav_path = get_wav_filename(audio_path, tmpdir)
-                convert_mp4_to_wav(audio_path, wav_path)
-                audio_path = wav_path
+            audio_path = self._sibling_wav(audio_path)
 
         # Get embeddings for each speaker
         speaker_embeddings = self.get_speaker_embeddings(
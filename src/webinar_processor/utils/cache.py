@@ -0,0 +1,104 @@
+"""Persistent per-user cache for expensive pipeline results."""
+
+import hashlib
+import logging
+import os
+import tempfile
+from typing import TYPE_CHECKING, Any, Optional
+
+import orjson
+
+from webinar_processor.utils.io import load_json
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def user_cache_dir(*parts: str) -> str:
+    """
+    Return a directory under the user's cache (XDG_CACHE_HOME or ~/.cache).
+
+    Args:
+        *parts: Subdirectory names below webinar-processor/
+
+    Returns:
+        Path to the directory (not created)
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "webinar-processor", *parts)
+
+
+def audio_cache_key(audio: "np.ndarray", *params: str) -> str:
+    """
+    Build a content-addressed key from decoded audio samples and parameters.
+
+    Hashing the PCM rather than the source file means re-muxed or renamed
+    copies of the same recording share one entry.
+
+    Args:
+        audio: Decoded waveform
+        *params: Settings that change the result (language, model, ...)
+
+    Returns:
+        Hex digest identifying audio + params
+    """
+    # Hash the sample buffer in place; only non-contiguous views get copied
+    digest = hashlib.sha256(audio.data if audio.flags.c_contiguous else audio.tobytes())
+    for param in params:
+        digest.update(b"\0" + str(param).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _entry_path(namespace: str, key: str) -> str:
+    return os.path.join(user_cache_dir(namespace), f"{key}.json")
+
+
+def load_cached(namespace: str, key: str) -> Optional[Any]:
+    """
+    Load a cached JSON value.
+
+    Args:
+        namespace: Cache subdirectory
+        key: Entry key
+
+    Returns:
+        The stored value, or None if missing or unreadable
+    """
+    path = _entry_path(namespace, key)
+    try:
+        return load_json(path)
+    except FileNotFoundError:
+        return None
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning("Ignoring unreadable cache entry %s: %s", path, e)
+        return None
+
+
+def store_cached(namespace: str, key: str, value: Any) -> None:
+    """
+    Store a JSON value atomically; failures are logged, not raised.
+
+    Args:
+        namespace: Cache subdirectory
+        key: Entry key
+        value: JSON-serializable value
+    """
+    path = _entry_path(namespace, key)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename so concurrent readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(
+                    value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                ))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError) as e:
+        # TypeError covers orjson.JSONEncodeError for unserializable values
+        logger.warning("Could not write cache entry %s: %s", path, e)
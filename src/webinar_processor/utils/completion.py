@@ -1,4 +1,7 @@
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Optional, TypeVar
 
 from webinar_processor.llm import LLMClient, LLMConfig, OUTPUT_LIMITS
 from webinar_processor.llm.exceptions import TokenLimitError
@@ -7,6 +10,10 @@ from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wai
 logger = logging.getLogger(__name__)
 
 _llm_client = None
+_llm_client_lock = threading.Lock()
+
+T = TypeVar('T')
+R = TypeVar('R')
 
 def get_output_limit(model: str) -> int:
     return OUTPUT_LIMITS.get(model, 4096)
@@ -14,11 +21,15 @@ def get_output_limit(model: str) -> int:
 def get_client():
     global _llm_client
     if _llm_client is None:
-        _llm_client = LLMClient()
+        with _llm_client_lock:
+            if _llm_client is None:
+                _llm_client = LLMClient()
     return _llm_client
 
-@retry(wait=wait_random_exponential(multiplier=1, min=30, max=120), stop=stop_after_attempt(7), retry=retry_if_not_exception_type(TokenLimitError))
-def get_completion(prompt, model=None, max_tokens=None):
+_llm_retry = retry(wait=wait_random_exponential(multiplier=1, min=30, max=120), stop=stop_after_attempt(7), retry=retry_if_not_exception_type(TokenLimitError))
+
+@_llm_retry
+def get_completion(prompt, model=None, max_tokens=None, system=None):
     """
     Generate a completion using the LLM client.
 
@@ -26,6 +37,7 @@ def get_completion(prompt, model=None, max_tokens=None):
         prompt: The text prompt to send to the LLM
         model: The model name to use (defaults to 'default' from config)
         max_tokens: Maximum tokens in response (defaults to model's output limit)
+        system: Optional static instruction sent as the system message
 
     Returns:
         The generated text response from the LLM
@@ -38,4 +50,54 @@ def get_completion(prompt, model=None, max_tokens=None):
         model = LLMConfig.get_model('default')
     if max_tokens is None:
         max_tokens = get_output_limit(model)
-    return client.generate(prompt, model=model, max_tokens=max_tokens)
+    return client.generate(prompt, model=model, max_tokens=max_tokens, system=system)
+
+@_llm_retry
+def stream_completion(prompt, model=None, max_tokens=None, system=None) -> Iterator[str]:
+    """
+    Start a streaming completion using the LLM client.
+
+    Only opening the stream is retried; an error after the first delta has
+    been yielded is raised to the caller, since output may already be written.
+
+    Args:
+        prompt: The text prompt to send to the LLM
+        model: The model name to use (defaults to 'default' from config)
+        max_tokens: Maximum tokens in response (defaults to model's output limit)
+        system: Optional static instruction sent as the system message
+
+    Returns:
+        Iterator over text deltas as they arrive
+
+    Raises:
+        LLMError: When LLM generation fails (e.g., API errors, network issues)
+    """
+    client = get_client()
+    if model is None:
+        model = LLMConfig.get_model('default')
+    if max_tokens is None:
+        max_tokens = get_output_limit(model)
+    return client.stream(prompt, model=model, max_tokens=max_tokens, system=system)
+
+def run_concurrently(func: Callable[[T], R], items: Iterable[T], max_workers: Optional[int] = None) -> List[R]:
+    """
+    Apply func to each item on a bounded thread pool, preserving input order.
+
+    Intended for independent, network-bound LLM calls. Exceptions raised by
+    func propagate to the caller.
+
+    Args:
+        func: Callable applied to each item
+        items: Inputs to process
+        max_workers: Pool size (defaults to LLM_MAX_CONCURRENCY)
+
+    Returns:
+        List of results in the same order as items
+    """
+    items = list(items)
+    if max_workers is None:
+        max_workers = LLMConfig.get_max_concurrency()
+    if len(items) <= 1 or max_workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
@@ -0,0 +1,20 @@
+"""Process-wide .env loading for commands that need credentials."""
+
+from functools import lru_cache
+
+from dotenv import find_dotenv, load_dotenv
+
+
+@lru_cache(maxsize=1)
+def load_env() -> bool:
+    """
+    Load the nearest .env file (searching up from the working directory) once.
+
+    Batch commands resolve credentials once per item; caching avoids walking
+    the directory tree and re-parsing the file each time. Variables already
+    set in the environment are not overridden.
+
+    Returns:
+        True if a .env file was found and loaded
+    """
+    return load_dotenv(find_dotenv(usecwd=True))
@@ -6,8 +6,18 @@ import subprocess
 import tempfile
 from typing import List, Optional, Tuple
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Conservative loudness/dynamics normalization; keeps timing stable for diarization
+_NORMALIZE_FILTER = (
+    "loudnorm=I=-16:TP=-1.5:LRA=11,acompressor=threshold=-21dB:ratio=3:attack=5:release=50"
+)
+
+# Take only the first audio stream and skip video/subtitle/data decoding
+_AUDIO_ONLY = ["-map", "0:a:0", "-vn", "-sn", "-dn"]
+
 
 def get_wav_filename(input_path: str, output_dir: str) -> str:
     """
@@ -25,39 +35,23 @@ def get_wav_filename(input_path: str, output_dir: str) -> str:
     return os.path.join(output_dir, wav_filename)
 
 
-def extract_audio_slice(
-    input_path: str,
-    output_path: str,
-    start_seconds: float,
-    duration_seconds: float,
-    sample_rate: int = 16000,
-):
+def convert_mp4_to_wav(input_path: str, output_path: str, sample_rate: int = 16000):
     cmd = [
         "ffmpeg",
         "-y",
-        "-ss",
-        str(start_seconds),
-        "-t",
-        str(duration_seconds),
+        "-threads",
+        "0",
         "-i",
         input_path,
-        "-ar",
-        str(sample_rate),
+        *_AUDIO_ONLY,
+        "-acodec",
+        "pcm_s16le",
         "-ac",
         "1",
+        "-ar",
+        str(sample_rate),
         output_path,
     ]
-    try:
-        subprocess.run(cmd, check=True, capture_output=True)
-    except subprocess.CalledProcessError as e:
-        logger.error(
-            f"extract_audio_slice failed: {e.stderr.decode() if e.stderr else e}"
-        )
-        raise
-
-
-def convert_mp4_to_wav(input_path: str, output_path: str, sample_rate: int = 16000):
-    cmd = ["ffmpeg", "-y", "-i", input_path, "-ar", str(sample_rate), output_path]
     try:
         subprocess.run(cmd, check=True, capture_output=True)
     except subprocess.CalledProcessError as e:
@@ -75,10 +69,13 @@ def normalize_audio_file(input_path: str, output_path: str, sample_rate: int = 1
     cmd = [
         "ffmpeg",
         "-y",
+        "-threads",
+        "0",
         "-i",
         input_path,
+        *_AUDIO_ONLY,
         "-af",
-        "loudnorm=I=-16:TP=-1.5:LRA=11,acompressor=threshold=-21dB:ratio=3:attack=5:release=50",
+        _NORMALIZE_FILTER,
         "-ar",
         str(sample_rate),
         "-ac",
@@ -94,6 +91,54 @@ def normalize_audio_file(input_path: str, output_path: str, sample_rate: int = 1
         raise
 
 
+def load_audio(
+    input_path: str,
+    sample_rate: int = 16000,
+    normalize: bool = False,
+    start: Optional[float] = None,
+    duration: Optional[float] = None,
+) -> np.ndarray:
+    """Decode any audio/video file to a mono float32 waveform via an ffmpeg pipe.
+
+    Avoids writing and re-reading an intermediate WAV file.
+
+    Args:
+        input_path: Path to audio or video file
+        sample_rate: Output sample rate
+        normalize: Apply the same loudness normalization as normalize_audio_file
+        start: Decode from this offset in seconds (input seek)
+        duration: Decode at most this many seconds
+
+    Returns:
+        1-D float32 array with samples in [-1, 1)
+
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg fails
+    """
+    cmd = ["ffmpeg", "-nostdin", "-threads", "0"]
+    if start is not None:
+        cmd += ["-ss", str(start)]
+    if duration is not None:
+        cmd += ["-t", str(duration)]
+    cmd += ["-i", input_path, *_AUDIO_ONLY]
+    if normalize:
+        cmd += ["-af", _NORMALIZE_FILTER]
+    cmd += ["-f", "s16le", "-acodec", "pcm_s16le", "-ac", "1", "-ar", str(sample_rate), "-"]
+    try:
+        out = subprocess.run(cmd, check=True, capture_output=True).stdout
+    except subprocess.CalledProcessError as e:
+        logger.error(
+            f"load_audio failed: {e.stderr.decode() if e.stderr else e}"
+        )
+        raise
+    audio = np.frombuffer(out, np.int16).astype(np.float32)
+    # Free the PCM bytes and scale in place: `/ 32768.0` would allocate a
+    # second full-length float32 array (hundreds of MB for a long webinar)
+    del out
+    audio *= 1 / 32768.0
+    return audio
+
+
 def get_video_duration(video_path: str) -> float:
     """Get video duration using ffprobe.
 
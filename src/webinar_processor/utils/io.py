@@ -1,7 +1,11 @@
 """Common I/O utilities for CLI commands."""
 
-from typing import Optional
+import json
+import os
+import string
+from typing import Any, Callable, Iterable, Optional
 import click
+import orjson
 
 
 def load_prompt_template(prompt_path: str) -> str:
@@ -28,6 +32,78 @@ def load_prompt_template(prompt_path: str) -> str:
         raise click.Abort()
 
 
+def compile_template(template: str) -> Callable[..., str]:
+    """
+    Pre-parse a str.format template into a substitution function.
+
+    The template is parsed once, so rendering it in a loop is plain string
+    concatenation. Only named fields without format specs or conversions are
+    pre-parsed; anything else falls back to template.format.
+
+    Args:
+        template: Template text using str.format syntax (e.g. "{text}", "{{")
+
+    Returns:
+        Function taking keyword arguments and returning the rendered string
+    """
+    parsed = list(string.Formatter().parse(template))
+    if any(
+        spec or conversion or (field is not None and not field.isidentifier())
+        for _, field, spec, conversion in parsed
+    ):
+        return template.format
+    parts = [(literal, field) for literal, field, _, _ in parsed]
+
+    def render(**kwargs: Any) -> str:
+        out = []
+        for literal, field in parts:
+            out.append(literal)
+            if field is not None:
+                out.append(str(kwargs[field]))
+        return ''.join(out)
+
+    return render
+
+
+def write_json(path: str, data: Any, indent: int = 4) -> None:
+    """
+    Write a human-readable UTF-8 JSON file.
+
+    Uses the stdlib encoder so files keep the exact layout earlier versions
+    wrote (non-ASCII text as-is, same indentation); orjson can only indent
+    by 2, which would re-format every existing transcript.
+
+    Args:
+        path: Output file path
+        data: JSON-serializable value
+        indent: Spaces per indentation level
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent)
+
+
+def load_json(path: str) -> Any:
+    """
+    Load a JSON file with orjson.
+
+    Reads the file as bytes in one call and parses it without decoding to
+    str first, which is several times faster than json.load on multi-hour
+    transcripts.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        The parsed JSON value
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
 def write_output(content: str, output_file: Optional[str] = None) -> None:
     """
     Write content to file or stdout with error handling.
@@ -52,3 +128,48 @@ def write_output(content: str, output_file: Optional[str] = None) -> None:
         click.echo(content)
 
 
+def stream_output(chunks: Iterable[str], output_file: Optional[str] = None) -> str:
+    """
+    Write streamed content to file or stdout as each chunk arrives.
+
+    File output streams into "<output_file>.part", which is renamed to
+    output_file only once every chunk has arrived. If the chunks raise
+    part-way (e.g. an LLM error), the partial file is removed, so a
+    truncated output never looks finished.
+
+    Args:
+        chunks: Iterable of text fragments (e.g. LLM stream deltas)
+        output_file: Optional path to output file. If None, prints to stdout.
+
+    Returns:
+        The full content that was written
+
+    Raises:
+        click.Abort: If file cannot be written
+    """
+    parts = []
+    if output_file:
+        part_file = output_file + ".part"
+        try:
+            try:
+                with open(part_file, "w", encoding="utf-8") as f:
+                    for chunk in chunks:
+                        f.write(chunk)
+                        f.flush()
+                        parts.append(chunk)
+                os.replace(part_file, output_file)
+            except BaseException:
+                if os.path.exists(part_file):
+                    os.unlink(part_file)
+                raise
+            click.echo(click.style(f'Written to {output_file}', fg='green'))
+        except IOError as e:
+            click.echo(click.style(f'Error writing output file: {e}', fg='red'))
+            click.echo(''.join(parts))
+            raise click.Abort()
+    else:
+        for chunk in chunks:
+            click.echo(chunk, nl=False)
+            parts.append(chunk)
+        click.echo()
+    return ''.join(parts)
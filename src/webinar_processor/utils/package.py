@@ -1,4 +1,11 @@
 import importlib.resources
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _conf_dir():
+    """Resolve the packaged resources/conf directory once per process."""
+    return importlib.resources.files('webinar_processor').joinpath('resources', 'conf')
 
 
 def get_config_path(config_name: str) -> str:
@@ -11,5 +18,6 @@ def get_config_path(config_name: str) -> str:
     Returns:
         The absolute path to the configuration file as a string
     """
-    with importlib.resources.files('webinar_processor').joinpath('resources', 'conf', config_name) as path:
-        return str(path)
+    # files() of a regular package is a pathlib.Path; using it as a context
+    # manager is deprecated, and str() of it is already a usable path
+    return str(_conf_dir().joinpath(config_name))
@@ -1,12 +1,37 @@
 """Token utilities for LLM operations."""
 
-import tiktoken
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, List
+
+from webinar_processor.utils.cache import user_cache_dir
+
+if TYPE_CHECKING:
+    import tiktoken
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str) -> "tiktoken.Encoding":
+    """Return the tiktoken encoding for model, building it once per process."""
+    # tiktoken defaults to a cache under the system temp dir, which is often
+    # wiped between runs; keep the BPE files somewhere that survives
+    os.environ.setdefault("TIKTOKEN_CACHE_DIR", user_cache_dir("tiktoken"))
+    # Imported here so CLI start-up doesn't pay for tiktoken unless tokens are counted
+    import tiktoken
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.encoding_for_model("gpt-4o")
 
 
 def count_tokens(model: str, text: str) -> int:
     """
     Count tokens in text using tiktoken, with fallback for unknown models.
 
+    Special-token markers such as <|endoftext|> are counted as plain text;
+    only their length matters here, and encode() would raise on them.
+
     Args:
         model: The model name to use for tokenization
         text: The text to tokenize
@@ -14,8 +39,22 @@ def count_tokens(model: str, text: str) -> int:
     Returns:
         Number of tokens in the text
     """
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        encoding = tiktoken.encoding_for_model("gpt-4o")
-    return len(encoding.encode(text))
+    return len(_get_encoding(model).encode_ordinary(text))
+
+
+def count_tokens_batch(model: str, texts: Iterable[str]) -> List[int]:
+    """
+    Count tokens for many texts in one tiktoken call.
+
+    encode_ordinary_batch tokenizes on tiktoken's native thread pool, which
+    is much faster than calling count_tokens in a Python loop over short
+    strings.
+
+    Args:
+        model: The model name to use for tokenization
+        texts: The texts to tokenize
+
+    Returns:
+        Number of tokens for each text, in input order
+    """
+    return [len(tokens) for tokens in _get_encoding(model).encode_ordinary_batch(list(texts))]
@@ -6,6 +6,9 @@ from typing import Optional, List
 
 logger = logging.getLogger(__name__)
 
+# Sentence end followed by whitespace and an uppercase letter
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?…])\s+(?=[А-ЯЁA-Z])')
+
 
 def identify_main_speaker(segments: list) -> Optional[str]:
     """
@@ -118,13 +121,23 @@ def is_diarized_format(data) -> bool:
     return isinstance(first, dict) and 'text' in first and 'start' in first
 
 
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences with a rule-based punctuation splitter.
+
+    Breaks on '.', '!', '?' or '…' followed by whitespace and an uppercase
+    Cyrillic or Latin letter, which is enough for ASR output and avoids
+    loading an NLP model.
+    """
+    return _SENTENCE_SPLIT_RE.split(text)
+
+
 def add_paragraph_breaks(text: str, sentences_per_paragraph: int = 5) -> str:
     """
     Add paragraph breaks to flat text that has no newlines.
     Groups sentences into paragraphs for readability.
     """
-    # Split on sentence endings followed by a space and uppercase letter
-    sentences = re.split(r'(?<=[.!?])\s+(?=[А-ЯA-Z])', text)
+    sentences = split_sentences(text)
 
     paragraphs = []
     for i in range(0, len(sentences), sentences_per_paragraph):
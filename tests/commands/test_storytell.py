@@ -0,0 +1,45 @@
+import json
+import pytest
+from unittest.mock import patch
+from click.testing import CliRunner
+
+from webinar_processor.commands.cmd_storytell import storytell
+from webinar_processor.llm import LLMError
+
+
+@pytest.fixture
+def runner():
+    return CliRunner()
+
+
+@pytest.fixture
+def asr_file(tmp_path):
+    path = tmp_path / "transcript.json"
+    path.write_text(json.dumps({"text": "Текст лекции."}, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+class TestStorytellCLI:
+    def test_article_written(self, runner, asr_file, tmp_path):
+        output = tmp_path / "story.txt"
+        with patch("webinar_processor.commands.cmd_storytell.iter_article", return_value=iter(["# Глава", "\n\nТекст"])):
+            result = runner.invoke(storytell, [str(asr_file), "--model", "gpt-4o", "--output-file", str(output)])
+
+        assert result.exit_code == 0, result.output
+        assert output.read_text(encoding="utf-8") == "# Глава\n\nТекст"
+
+    def test_failure_mid_article_leaves_no_output(self, runner, asr_file, tmp_path):
+        output = tmp_path / "story.txt"
+
+        def chunks(*args, **kwargs):
+            yield "# Глава\n\n"
+            yield "Первый раздел"
+            raise LLMError("rate limited")
+
+        with patch("webinar_processor.commands.cmd_storytell.iter_article", side_effect=chunks):
+            result = runner.invoke(storytell, [str(asr_file), "--model", "gpt-4o", "--output-file", str(output)])
+
+        assert result.exit_code != 0
+        assert "rate limited" in result.output
+        assert not output.exists()
+        assert not (tmp_path / "story.txt.part").exists()
@@ -58,9 +58,9 @@ def transcript_and_report():
 
 class TestTranscriptFixCLI:
     @patch('webinar_processor.services.transcript_fixer_service.get_completion')
-    @patch('webinar_processor.services.transcript_fixer_service.extract_audio_slice')
+    @patch('webinar_processor.services.transcript_fixer_service.load_audio')
     @patch('webinar_processor.services.transcript_fixer_service.RetranscriptionService')
-    def test_fix_succeeds(self, mock_retrans_cls, mock_extract, mock_completion,
+    def test_fix_succeeds(self, mock_retrans_cls, mock_load_audio, mock_completion,
                           runner, transcript_and_report):
         transcript_path, report_path, media_path = transcript_and_report
 
@@ -96,6 +96,9 @@ class TestTranscriptFixCLI:
             with open(out_path, 'r') as f:
                 fixed = json.load(f)
             assert fixed[1]["text"] == "Исправленный текст."
+            audio = mock_load_audio.return_value
+            mock_retrans.transcribe_whisper.assert_called_with(audio)
+            mock_retrans.transcribe_qwen3.assert_called_with(audio)
         finally:
             for p in (out_path, fix_report_path):
                 if os.path.exists(p):
@@ -25,11 +25,41 @@ Testing approach:
 4. Verify outputs at each stage
 """
 
+import json
+from concurrent.futures import Future
 from unittest.mock import patch, Mock
+import numpy as np
+import pytest
 from click.testing import CliRunner
 from webinar_processor import cli
 
 
+@pytest.fixture(autouse=True)
+def no_model_preload():
+    """Keep transcribe from loading real ASR/diarization models in the background."""
+    done = Future()
+    done.set_result(None)
+    with patch(
+        "webinar_processor.commands.cmd_transcribe.preload_models", return_value=done
+    ) as preload:
+        yield preload
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch, tmp_path):
+    """Keep the transcript cache out of the real user cache directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+def fake_transcribe_and_diarize(asr_result, diarized):
+    """Stand-in for transcribe_and_diarize that reports ASR like the real one."""
+    def run(audio, language="ru", hf_token=None, on_asr=None):
+        if on_asr:
+            on_asr(asr_result)
+        return asr_result, diarized
+    return Mock(side_effect=run)
+
+
 def test_basic_workflow(mock_youtube, mock_openai, temp_dir):
     """
     Test basic webinar processing workflow: download -> transcribe.
@@ -56,8 +86,8 @@ def test_basic_workflow(mock_youtube, mock_openai, temp_dir):
         "webinar_processor.commands.cmd_yt_download.YouTube", return_value=mock_youtube
     ):
         with patch(
-            "webinar_processor.commands.cmd_yt_download.requests.get",
-            return_value=Mock(content=b"poster-bytes"),
+            "webinar_processor.commands.cmd_yt_download._SESSION.get",
+            return_value=Mock(iter_content=Mock(return_value=[b"poster-bytes"])),
         ):
             download_result = runner.invoke(
                 cli,
@@ -82,23 +112,21 @@ def test_basic_workflow(mock_youtube, mock_openai, temp_dir):
         side_effect=lambda input_path, output_path: None,
     ):
         with patch(
-            "webinar_processor.commands.cmd_transcribe.convert_mp4_to_wav",
-            side_effect=lambda input_path, output_path: None,
+            "webinar_processor.commands.cmd_transcribe.load_audio",
+            return_value=np.zeros(32000, dtype=np.float32),
         ):
             with patch(
-                "webinar_processor.commands.cmd_transcribe.transcribe_wav",
-                return_value={
-                    "text": "Test transcription",
-                    "segments": [
-                        {"start": 0.0, "end": 2.0, "text": "Test transcription"}
-                    ],
-                    "language": "english",
-                    "model": "large-v3",
-                },
-            ):
-                with patch(
-                    "webinar_processor.commands.cmd_transcribe.diarize_wav",
-                    return_value=[
+                "webinar_processor.commands.cmd_transcribe.transcribe_and_diarize",
+                return_value=(
+                    {
+                        "text": "Test transcription",
+                        "segments": [
+                            {"start": 0.0, "end": 2.0, "text": "Test transcription"}
+                        ],
+                        "language": "english",
+                        "model": "large-v3",
+                    },
+                    [
                         {
                             "start": 0.0,
                             "end": 2.0,
@@ -106,16 +134,17 @@ def test_basic_workflow(mock_youtube, mock_openai, temp_dir):
                             "text": "Test transcription",
                         }
                     ],
-                ):
-                    transcript_path = temp_dir / "transcript.json"
-                    transcribe_result = runner.invoke(
-                        cli,
-                        ["transcribe", str(video_path), str(transcript_path), "en"],
-                        catch_exceptions=True,
-                    )
-                    assert transcribe_result.exit_code == 0, (
-                        f"Transcribe command failed: {transcribe_result.output}"
-                    )
+                ),
+            ):
+                transcript_path = temp_dir / "transcript.json"
+                transcribe_result = runner.invoke(
+                    cli,
+                    ["transcribe", str(video_path), str(transcript_path), "en"],
+                    catch_exceptions=True,
+                )
+                assert transcribe_result.exit_code == 0, (
+                    f"Transcribe command failed: {transcribe_result.output}"
+                )
 
 
 def test_transcribe_with_audio_normalization(temp_dir):
@@ -131,16 +160,13 @@ def test_transcribe_with_audio_normalization(temp_dir):
         side_effect=lambda input_path, output_path: None,
     ):
         with patch(
-            "webinar_processor.commands.cmd_transcribe.convert_mp4_to_wav",
-            side_effect=lambda input_path, output_path: None,
-        ):
+            "webinar_processor.commands.cmd_transcribe.load_audio",
+            return_value=np.zeros(32000, dtype=np.float32),
+        ) as load_audio_mock:
             with patch(
-                "webinar_processor.commands.cmd_transcribe.normalize_audio_file",
-                side_effect=lambda input_path, output_path: None,
-            ) as normalize_mock:
-                with patch(
-                    "webinar_processor.commands.cmd_transcribe.transcribe_wav",
-                    return_value={
+                "webinar_processor.commands.cmd_transcribe.transcribe_and_diarize",
+                return_value=(
+                    {
                         "text": "Normalized test transcription",
                         "segments": [
                             {
@@ -152,32 +178,143 @@ def test_transcribe_with_audio_normalization(temp_dir):
                         "language": "russian",
                         "model": "large-v3",
                     },
-                ):
-                    with patch(
-                        "webinar_processor.commands.cmd_transcribe.diarize_wav",
-                        return_value=[
-                            {
-                                "start": 0.0,
-                                "end": 2.0,
-                                "speaker": "SPEAKER_00",
-                                "text": "Normalized test transcription",
-                            }
-                        ],
-                    ):
-                        transcribe_result = runner.invoke(
-                            cli,
-                            [
-                                "transcribe",
-                                "--normalize-audio",
-                                str(video_path),
-                                str(transcript_path),
-                                "ru",
-                            ],
-                            catch_exceptions=True,
-                        )
-                        assert transcribe_result.exit_code == 0, (
-                            f"Transcribe command failed: {transcribe_result.output}"
-                        )
-                        assert normalize_mock.call_count == 1, (
-                            "Normalization should run when --normalize-audio is enabled"
-                        )
+                    [
+                        {
+                            "start": 0.0,
+                            "end": 2.0,
+                            "speaker": "SPEAKER_00",
+                            "text": "Normalized test transcription",
+                        }
+                    ],
+                ),
+            ):
+                transcribe_result = runner.invoke(
+                    cli,
+                    [
+                        "transcribe",
+                        "--normalize-audio",
+                        str(video_path),
+                        str(transcript_path),
+                        "ru",
+                    ],
+                    catch_exceptions=True,
+                )
+                assert transcribe_result.exit_code == 0, (
+                    f"Transcribe command failed: {transcribe_result.output}"
+                )
+                assert load_audio_mock.call_args[1]["normalize"] is True, (
+                    "Normalization should run when --normalize-audio is enabled"
+                )
+
+
+def test_transcribe_batch_loads_models_once(temp_dir, no_model_preload):
+    """Test that transcribe-batch processes every file with a single model preload."""
+    runner = CliRunner()
+
+    video_paths = []
+    for name in ("first", "second"):
+        (temp_dir / name).mkdir()
+        video_path = temp_dir / name / "recording.mp4"
+        video_path.touch()
+        video_paths.append(video_path)
+
+    with patch(
+        "webinar_processor.commands.cmd_transcribe.mp4_silence_remove",
+        side_effect=lambda input_path, output_path: None,
+    ), patch(
+        "webinar_processor.commands.cmd_transcribe.load_audio",
+        side_effect=[np.zeros(32000, dtype=np.float32), np.ones(32000, dtype=np.float32)],
+    ), patch(
+        "webinar_processor.commands.cmd_transcribe.transcribe_and_diarize",
+        fake_transcribe_and_diarize(
+            {"text": "Test", "segments": [], "language": "russian", "model": "large-v3"}, []
+        ),
+    ) as transcribe_mock:
+        result = runner.invoke(cli, ["transcribe-batch"] + [str(p) for p in video_paths])
+
+    assert result.exit_code == 0, f"transcribe-batch failed: {result.output}"
+    no_model_preload.assert_called_once()
+    assert transcribe_mock.call_count == 2
+    for video_path in video_paths:
+        assert (video_path.parent / "transcript.json").exists()
+        assert (video_path.parent / "transcript.json.asr").exists()
+
+
+def test_transcribe_batch_rejects_shared_directory(temp_dir, no_model_preload):
+    """Test that videos sharing a directory are rejected before any work starts."""
+    runner = CliRunner()
+    for name in ("a.mp4", "b.mp4"):
+        (temp_dir / name).touch()
+
+    result = runner.invoke(
+        cli, ["transcribe-batch", str(temp_dir / "a.mp4"), str(temp_dir / "b.mp4")]
+    )
+
+    assert result.exit_code != 0
+    assert "own directory" in result.output
+    no_model_preload.assert_not_called()
+
+
+def test_transcribe_reuses_cached_result(temp_dir, no_model_preload):
+    """Test that transcribing the same audio twice skips ASR the second time."""
+    runner = CliRunner()
+    (temp_dir / "a").mkdir()
+    (temp_dir / "b").mkdir()
+    first = temp_dir / "a" / "recording.mp4"
+    copy = temp_dir / "b" / "copy.mp4"
+    first.touch()
+    copy.touch()
+
+    asr = {"text": "Test", "segments": [], "language": "russian", "model": "large-v3"}
+    diarized = [{"start": 0.0, "end": 2.0, "speaker": "SPEAKER_00", "text": "Test"}]
+    with patch(
+        "webinar_processor.commands.cmd_transcribe.mp4_silence_remove",
+        side_effect=lambda input_path, output_path: None,
+    ), patch(
+        "webinar_processor.commands.cmd_transcribe.load_audio",
+        return_value=np.zeros(32000, dtype=np.float32),
+    ), patch(
+        "webinar_processor.commands.cmd_transcribe.transcribe_and_diarize",
+        fake_transcribe_and_diarize(asr, diarized),
+    ) as transcribe_mock:
+        assert runner.invoke(cli, ["transcribe", str(first)]).exit_code == 0
+        result = runner.invoke(cli, ["transcribe", str(copy)])
+        assert result.exit_code == 0, result.output
+        assert "Using cached transcript" in result.output
+
+        assert transcribe_mock.call_count == 1
+        # A cache hit does not start loading models
+        assert no_model_preload.call_count == 1
+        assert json.loads((temp_dir / "b" / "transcript.json").read_text(encoding="utf-8")) == diarized
+
+        assert runner.invoke(cli, ["transcribe", "--no-cache", str(copy)]).exit_code == 0
+        assert transcribe_mock.call_count == 2
+        assert no_model_preload.call_count == 2
+
+
+def test_transcribe_keeps_asr_when_diarization_fails(temp_dir):
+    """Test that the .asr file survives a diarization failure for `diarize` to reuse."""
+    runner = CliRunner()
+    video_path = temp_dir / "recording.mp4"
+    video_path.touch()
+    asr = {"text": "Test", "segments": [], "language": "russian", "model": "large-v3"}
+
+    def fail_after_asr(audio, language="ru", hf_token=None, on_asr=None):
+        on_asr(asr)
+        raise RuntimeError("CUDA out of memory")
+
+    with patch(
+        "webinar_processor.commands.cmd_transcribe.mp4_silence_remove",
+        side_effect=lambda input_path, output_path: None,
+    ), patch(
+        "webinar_processor.commands.cmd_transcribe.load_audio",
+        return_value=np.zeros(32000, dtype=np.float32),
+    ), patch(
+        "webinar_processor.commands.cmd_transcribe.transcribe_and_diarize",
+        side_effect=fail_after_asr,
+    ):
+        result = runner.invoke(cli, ["transcribe", str(video_path)])
+
+    assert result.exit_code != 0
+    assert json.loads((temp_dir / "transcript.json.asr").read_text(encoding="utf-8")) == asr
+    assert not (temp_dir / "transcript.json").exists()
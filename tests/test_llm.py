@@ -91,6 +91,17 @@ class TestLLMConfig:
 
             assert LLMConfig.get_model("quiz") == "task-specific"
 
+    def test_get_max_concurrency(self):
+        """Test LLM_MAX_CONCURRENCY parsing with default and invalid values."""
+        from webinar_processor.llm.config import LLMConfig
+
+        with patch.dict("os.environ", {}, clear=True):
+            assert LLMConfig.get_max_concurrency() == 4
+        with patch.dict("os.environ", {"LLM_MAX_CONCURRENCY": "8"}, clear=True):
+            assert LLMConfig.get_max_concurrency() == 8
+        with patch.dict("os.environ", {"LLM_MAX_CONCURRENCY": "bogus"}, clear=True):
+            assert LLMConfig.get_max_concurrency() == 4
+
     def test_validate_success(self):
         """Test validate passes when API key is set."""
         with patch.dict("os.environ", {"LLM_API_KEY": "test-key"}):
@@ -182,6 +193,23 @@ class TestLLMClient:
                 call_args = mock_openai_client.chat.completions.create.call_args
                 assert call_args[1]["max_completion_tokens"] == 200
 
+    def test_generate_with_system_message(self, mock_openai_client):
+        """Test that a system instruction is sent before the user prompt."""
+        with patch.dict("os.environ", {"LLM_API_KEY": "test-key"}):
+            with patch("openai.OpenAI", return_value=mock_openai_client):
+                with patch("webinar_processor.llm.client.count_tokens", return_value=10) as mock_count:
+                    from webinar_processor.llm.client import LLMClient
+
+                    client = LLMClient()
+                    client.generate("Chunk text", system="Static instructions")
+
+                    messages = mock_openai_client.chat.completions.create.call_args[1]["messages"]
+                    assert messages == [
+                        {"role": "system", "content": "Static instructions"},
+                        {"role": "user", "content": "Chunk text"},
+                    ]
+                    assert mock_count.call_count == 2
+
     def test_generate_api_error_raises_llmerror(self, mock_openai_client):
         """Test that API errors raise LLMError."""
         from webinar_processor.llm.exceptions import LLMError
@@ -363,3 +391,65 @@ class TestLLMClient:
 
                 assert result == "Response"
                 mock_openai_client.chat.completions.create.assert_called_once()
+
+    def test_stream_yields_deltas(self, mock_openai_client):
+        """Test that stream yields non-empty content deltas in order."""
+        def chunk(content):
+            c = Mock()
+            c.choices = [Mock()]
+            c.choices[0].delta.content = content
+            return c
+
+        mock_openai_client.chat.completions.create.return_value = iter(
+            [chunk("Hello"), chunk(None), chunk(", world")]
+        )
+
+        with patch.dict("os.environ", {"LLM_API_KEY": "test-key"}):
+            with patch("openai.OpenAI", return_value=mock_openai_client):
+                with patch("webinar_processor.llm.client.count_tokens", return_value=10):
+                    from webinar_processor.llm.client import LLMClient
+
+                    client = LLMClient()
+                    result = list(client.stream("Test prompt", max_tokens=100))
+
+                    assert result == ["Hello", ", world"]
+                    call_args = mock_openai_client.chat.completions.create.call_args
+                    assert call_args[1]["stream"] is True
+
+    def test_stream_api_error_raises_llmerror(self, mock_openai_client):
+        """Test that errors opening the stream raise LLMError immediately."""
+        from webinar_processor.llm.exceptions import LLMError
+
+        mock_openai_client.chat.completions.create.side_effect = Exception("API Error")
+
+        with patch.dict("os.environ", {"LLM_API_KEY": "test-key"}):
+            with patch("openai.OpenAI", return_value=mock_openai_client):
+                with patch("webinar_processor.llm.client.count_tokens", return_value=10):
+                    from webinar_processor.llm.client import LLMClient
+
+                    client = LLMClient()
+                    with pytest.raises(LLMError):
+                        client.stream("Test prompt")
+
+
+class TestRunConcurrently:
+    def test_preserves_input_order(self):
+        """Test that results come back in input order regardless of completion order."""
+        import time
+        from webinar_processor.utils.completion import run_concurrently
+
+        def slow_echo(x):
+            time.sleep(0.01 * (5 - x))
+            return x * 10
+
+        assert run_concurrently(slow_echo, range(5), max_workers=5) == [0, 10, 20, 30, 40]
+
+    def test_propagates_exceptions(self):
+        """Test that an exception from a worker is raised to the caller."""
+        from webinar_processor.utils.completion import run_concurrently
+
+        def fail(x):
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            run_concurrently(fail, [1, 2], max_workers=2)
@@ -0,0 +1,135 @@
+from unittest.mock import patch
+
+from webinar_processor.services.storytell_service import _chunk_text_by_size
+
+
+# --- Helpers ---
+
+def _word_counts(model, texts):
+    """Stand-in tokenizer: one token per word."""
+    return [len(t.split()) for t in texts]
+
+
+# --- _chunk_text_by_size ---
+
+@patch("webinar_processor.services.storytell_service.count_tokens_batch", side_effect=_word_counts)
+class TestChunkTextBySize:
+    def test_fits_in_one_chunk(self, mock_counts):
+        text = "Первое предложение. Второе предложение."
+        assert _chunk_text_by_size(text, "gpt-4o", target_chunk_tokens=100) == [text]
+        mock_counts.assert_called_once()
+
+    def test_packs_sentences_with_overlap(self, mock_counts):
+        sentences = [f"Sentence number {i} here." for i in range(10)]  # 4 tokens each
+        text = " ".join(sentences)
+
+        chunks = _chunk_text_by_size(text, "gpt-4o", target_chunk_tokens=12, overlap_tokens=4)
+
+        assert chunks[0] == " ".join(sentences[0:3])
+        # Next chunk repeats the last sentence of the previous one
+        assert chunks[1].startswith(sentences[2])
+        assert chunks[-1].endswith(sentences[-1])
+        assert all(len(c.split()) <= 12 for c in chunks)
+        mock_counts.assert_called_once()
+
+    def test_oversized_sentence_split_on_whitespace(self, mock_counts):
+        long_sentence = " ".join(["word"] * 20) + "."
+        text = f"Short one. {long_sentence} Short two."
+
+        chunks = _chunk_text_by_size(text, "gpt-4o", target_chunk_tokens=5, overlap_tokens=0)
+
+        five_words = " ".join(["word"] * 5)
+        assert chunks == ["Short one."] + [five_words] * 3 + [five_words + ".", "Short two."]
+
+    def test_unpunctuated_text_stays_within_budget(self, mock_counts):
+        text = " ".join(f"слово{i}" for i in range(100))
+
+        chunks = _chunk_text_by_size(text, "gpt-4o", target_chunk_tokens=30, overlap_tokens=5)
+
+        assert len(chunks) > 1
+        assert all(len(c.split()) <= 30 for c in chunks)
+        assert chunks[0].startswith("слово0 ")
+        assert chunks[-1].endswith("слово99")
+
+
+# --- _storytell_chunked ---
+
+class TestStorytellChunkedReduce:
+    def test_notes_merged_pairwise_until_they_fit(self):
+        """Notes over budget are re-condensed in adjacent pairs, then the outline runs."""
+        from webinar_processor.services import storytell_service as svc
+
+        calls = []
+
+        def fake_completion(prompt, model, system=None):
+            calls.append(prompt)
+            return "N"
+
+        def fake_count(model, text):
+            return text.count("\n=== ") * 100 + 100  # 100 tokens per part
+
+        with patch.object(svc, "_chunk_text_by_size", return_value=["a", "b", "c", "d", "e"]), \
+                patch.object(svc, "load_prompt_template", side_effect=["SYS", "{chunk_index}/{total_chunks}:{text}"]), \
+                patch.object(svc, "_get_completion_safe", side_effect=fake_completion), \
+                patch.object(svc, "count_tokens", side_effect=fake_count), \
+                patch.dict(svc.TOKEN_LIMITS, {"m": 3000 + 1000 + 250}), \
+                patch.object(svc, "get_output_limit", return_value=1000), \
+                patch.object(svc, "_storytell_with_outline", return_value=iter(["article"])) as outline:
+            assert list(svc._storytell_chunked("text", None, "m")) == ["article"]
+
+        # 5 condense calls, then 2 merges (e passes through), then 1 merge
+        assert len(calls) == 5 + 2 + 1
+        combined = outline.call_args[0][0]
+        assert combined.count("=== Часть") == 2
+
+    def test_reduction_stops_when_no_merge_succeeds(self):
+        """Failed merges are not fed back as ever larger concatenations."""
+        from webinar_processor.services import storytell_service as svc
+
+        calls = []
+
+        def fake_completion(prompt, model, system=None):
+            calls.append(prompt)
+            return "N" if len(calls) <= 4 else None
+
+        def fake_count(model, text):
+            return text.count("\n=== ") * 100 + 100
+
+        with patch.object(svc, "_chunk_text_by_size", return_value=["a", "b", "c", "d"]), \
+                patch.object(svc, "load_prompt_template", side_effect=["SYS", "{chunk_index}/{total_chunks}:{text}", "{notes}"]), \
+                patch.object(svc, "_get_completion_safe", side_effect=fake_completion), \
+                patch.object(svc, "count_tokens", side_effect=fake_count), \
+                patch.dict(svc.TOKEN_LIMITS, {"m": 3000 + 1000 + 250}), \
+                patch.object(svc, "get_output_limit", return_value=1000), \
+                patch.object(svc, "stream_completion", return_value=iter(["article"])) as stream:
+            assert list(svc._storytell_chunked("text", None, "m")) == ["article"]
+
+        # 4 condense calls, one failed round of 2 merges, then single-pass from notes
+        assert len(calls) == 4 + 2
+        assert stream.call_args[0][0].count("=== Часть") == 4
+
+
+# --- generate_article ---
+
+class TestGenerateArticle:
+    def test_outline_sections_joined(self):
+        from webinar_processor.services import storytell_service as svc
+
+        outline = '{"chapter_title": "Глава", "sections": [{"id": "S1", "title": "Раз"}, {"id": "S2", "title": "Два"}]}'
+        with patch.object(svc, "count_tokens", return_value=10), \
+                patch.object(svc, "load_prompt_template", return_value="prompt"), \
+                patch.object(svc, "_get_completion_safe", side_effect=[outline, "текст 1", "текст 2"]):
+            article = svc.generate_article("transcript", "gpt-4o", no_appendix=True)
+
+        assert article == "# Глава\n\n\n## Раз\n\nтекст 1\n\n## Два\n\nтекст 2"
+
+    def test_single_pass_streams(self):
+        from webinar_processor.services import storytell_service as svc
+
+        with patch.object(svc, "count_tokens", return_value=10), \
+                patch.object(svc, "load_prompt_template", return_value="{text}"), \
+                patch.object(svc, "stream_completion", return_value=iter(["Ст", "атья"])) as stream:
+            chunks = list(svc.iter_article("transcript", "gpt-4o", single_pass=True))
+
+        assert chunks == ["Ст", "атья"]
+        assert stream.call_args[0][0] == "transcript"
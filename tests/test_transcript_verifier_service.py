@@ -170,6 +170,69 @@ class TestRunHeuristics:
         assert len(seg1_issues) >= 2
 
 
+# --- run_llm_verification ---
+
+def _issue(n, seg_idx):
+    return TranscriptIssue(
+        issue_id=f"ISS-{n:03d}", status="open", severity="high",
+        rule_id="repetition_loop", segment_indices=[seg_idx],
+        time_range={"start": 0.0, "end": 1.0}, speaker_ids=["SPEAKER_01"],
+        left_valid_index=None, right_valid_index=None, evidence={"k": "v"},
+    )
+
+
+class TestRunLLMVerification:
+    @patch('webinar_processor.services.transcript_verifier_service.get_completion')
+    def test_batches_candidates_into_one_request(self, mock_completion):
+        mock_completion.return_value = json.dumps([
+            {"id": 1, "decision": "problem", "confidence": 0.9, "reason": "a"},
+            {"id": 2, "decision": "no_problem", "confidence": 0.7, "reason": "b"},
+            {"id": 3, "decision": "problem", "confidence": 0.6, "reason": "c"},
+        ])
+        segments = [_seg(i, i + 1) for i in range(3)]
+        issues = [_issue(i + 1, i) for i in range(3)]
+
+        run_llm_verification(segments, issues, "gpt-5-mini", batch_size=4)
+
+        assert mock_completion.call_count == 1
+        assert "ФРАГМЕНТ 3" in mock_completion.call_args[0][0]
+        assert [i.llm_verdict.decision for i in issues] == ["problem", "no_problem", "problem"]
+
+    @patch('webinar_processor.services.transcript_verifier_service.get_completion')
+    def test_unparseable_batch_falls_back_to_single_requests(self, mock_completion):
+        single = json.dumps({"decision": "no_problem", "confidence": 0.8, "reason": "ok"})
+        mock_completion.side_effect = ["[]", single, single]
+        segments = [_seg(i, i + 1) for i in range(2)]
+        issues = [_issue(i + 1, i) for i in range(2)]
+
+        run_llm_verification(segments, issues, "gpt-5-mini", batch_size=4)
+
+        assert mock_completion.call_count == 3
+        assert all(i.llm_verdict.decision == "no_problem" for i in issues)
+
+    @patch('webinar_processor.services.transcript_verifier_service.get_completion')
+    def test_batches_sent_independently(self, mock_completion):
+        def reply(prompt, model=None):
+            if "### ФРАГМЕНТ" not in prompt:
+                return json.dumps({"decision": "no_problem", "confidence": 0.5, "reason": "single"})
+            if "<<<\ntext 2" in prompt:
+                return "not json"
+            return json.dumps([
+                {"decision": "problem", "confidence": 0.9, "reason": "batch"},
+                {"decision": "problem", "confidence": 0.9, "reason": "batch"},
+            ])
+
+        mock_completion.side_effect = reply
+        segments = [_seg(i, i + 1, text=f"text {i}") for i in range(5)]
+        issues = [_issue(i + 1, i) for i in range(5)]
+
+        run_llm_verification(segments, issues, "gpt-5-mini", batch_size=2)
+
+        # 3 batch requests (last one is a single), then 2 singles for the failed batch
+        assert mock_completion.call_count == 3 + 2
+        assert [i.llm_verdict.reason for i in issues] == ["batch", "batch", "single", "single", "single"]
+
+
 # --- generate_report ---
 
 class TestGenerateReport:
@@ -0,0 +1,446 @@
+import random
+import sys
+from collections import namedtuple
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from webinar_processor.services import transcription_service
+from webinar_processor.services.transcription_service import (
+    diarize_wav,
+    preload_models,
+    transcribe_and_diarize,
+    transcribe_wav,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_model_cache():
+    transcription_service._load_whisper_model.cache_clear()
+    transcription_service._load_faster_whisper_model.cache_clear()
+    transcription_service._load_diarization_pipeline.cache_clear()
+    yield
+    transcription_service._load_whisper_model.cache_clear()
+    transcription_service._load_faster_whisper_model.cache_clear()
+    transcription_service._load_diarization_pipeline.cache_clear()
+
+
+@pytest.fixture
+def fake_whisper():
+    whisper = MagicMock()
+    whisper.load_model.return_value.transcribe.return_value = {
+        "text": "Привет",
+        "segments": [{"start": 0.0, "end": 1.0, "text": "Привет"}],
+    }
+    with patch.dict(sys.modules, {"whisper": whisper}):
+        yield whisper
+
+
+@pytest.fixture
+def fake_faster_whisper():
+    segment = MagicMock(
+        id=0, seek=0, start=0.0, end=1.5, text=" Привет", tokens=(1, 2),
+        temperature=0.0, avg_logprob=-0.1, compression_ratio=1.0, no_speech_prob=0.01,
+    )
+    faster_whisper = MagicMock()
+    model = faster_whisper.WhisperModel.return_value
+    model.transcribe.side_effect = lambda *args, **kwargs: (iter([segment]), MagicMock())
+    ctranslate2 = MagicMock()
+    ctranslate2.get_cuda_device_count.return_value = 0
+    with patch.dict(sys.modules, {"faster_whisper": faster_whisper, "ctranslate2": ctranslate2}):
+        yield faster_whisper
+
+
+class TestTranscribeWav:
+    def test_model_loaded_once_across_calls(self, fake_whisper, monkeypatch):
+        monkeypatch.delenv("ASR_WHISPER_MODEL", raising=False)
+        monkeypatch.setenv("ASR_BACKEND", "whisper")
+
+        transcribe_wav("a.wav")
+        transcribe_wav("b.wav")
+
+        fake_whisper.load_model.assert_called_once_with("large-v3")
+        assert fake_whisper.load_model.return_value.transcribe.call_count == 2
+
+    def test_result_shape(self, fake_whisper, monkeypatch):
+        monkeypatch.setenv("ASR_WHISPER_MODEL", "small")
+        monkeypatch.setenv("ASR_BACKEND", "whisper")
+
+        result = transcribe_wav("a.wav", language="en")
+
+        assert result["language"] == "english"
+        assert result["model"] == "small"
+        kwargs = fake_whisper.load_model.return_value.transcribe.call_args[1]
+        assert kwargs["condition_on_previous_text"] is False
+        assert kwargs["fp16"] is False
+        assert result["text"] == "Привет"
+        assert len(result["segments"]) == 1
+
+    def test_faster_whisper_backend(self, fake_faster_whisper, monkeypatch):
+        monkeypatch.setenv("ASR_BACKEND", "faster-whisper")
+        monkeypatch.delenv("ASR_WHISPER_MODEL", raising=False)
+        monkeypatch.delenv("ASR_COMPUTE_TYPE", raising=False)
+        monkeypatch.delenv("ASR_BATCH_SIZE", raising=False)
+
+        result = transcribe_wav("a.wav", language="ru")
+        transcribe_wav("b.wav", language="ru")
+
+        fake_faster_whisper.WhisperModel.assert_called_once_with(
+            "large-v3", device="auto", compute_type="int8"
+        )
+        model = fake_faster_whisper.WhisperModel.return_value
+        kwargs = model.transcribe.call_args[1]
+        assert kwargs["language"] == "ru"
+        assert kwargs["vad_filter"] is True
+        assert kwargs["beam_size"] == 1
+        assert kwargs["condition_on_previous_text"] is False
+        assert result["language"] == "russian"
+        assert result["text"] == " Привет"
+        assert result["segments"][0]["start"] == 0.0
+        assert result["segments"][0]["tokens"] == [1, 2]
+
+    def test_faster_whisper_batched_on_gpu(self, fake_faster_whisper, monkeypatch):
+        monkeypatch.setenv("ASR_BACKEND", "faster-whisper")
+        monkeypatch.delenv("ASR_BATCH_SIZE", raising=False)
+        monkeypatch.delenv("ASR_VAD_FILTER", raising=False)
+        sys.modules["ctranslate2"].get_cuda_device_count.return_value = 1
+        batched = fake_faster_whisper.BatchedInferencePipeline.return_value
+        batched.transcribe.side_effect = fake_faster_whisper.WhisperModel.return_value.transcribe.side_effect
+
+        result = transcribe_wav("a.wav", language="ru")
+
+        model = fake_faster_whisper.WhisperModel.return_value
+        fake_faster_whisper.BatchedInferencePipeline.assert_called_once_with(model=model)
+        kwargs = batched.transcribe.call_args[1]
+        assert kwargs["batch_size"] == 8
+        assert kwargs["without_timestamps"] is False
+        assert kwargs["vad_filter"] is True
+        model.transcribe.assert_not_called()
+        assert result["segments"][0]["end"] == 1.5
+
+    def test_faster_whisper_batching_needs_vad(self, fake_faster_whisper, monkeypatch):
+        monkeypatch.setenv("ASR_BACKEND", "faster-whisper")
+        monkeypatch.setenv("ASR_BATCH_SIZE", "16")
+        monkeypatch.setenv("ASR_VAD_FILTER", "0")
+
+        transcribe_wav("a.wav")
+
+        fake_faster_whisper.BatchedInferencePipeline.assert_not_called()
+        fake_faster_whisper.WhisperModel.return_value.transcribe.assert_called_once()
+
+    def test_asr_skips_silence(self, monkeypatch):
+        monkeypatch.delenv("ASR_VAD_FILTER", raising=False)
+        monkeypatch.setenv("ASR_BACKEND", "whisper")
+        assert transcription_service.asr_skips_silence() is False
+
+        monkeypatch.setenv("ASR_BACKEND", "faster-whisper")
+        assert transcription_service.asr_skips_silence() is True
+
+        monkeypatch.setenv("ASR_VAD_FILTER", "0")
+        assert transcription_service.asr_skips_silence() is False
+
+    def test_preload_then_transcribe_loads_once(self, fake_whisper, monkeypatch):
+        monkeypatch.setenv("ASR_BACKEND", "whisper")
+        monkeypatch.delenv("HUGGING_FACE_TOKEN", raising=False)
+
+        preload_models().result(timeout=5)
+        transcribe_wav("a.wav")
+
+        fake_whisper.load_model.assert_called_once()
+
+    def test_preload_failure_is_logged_not_raised(self, fake_whisper, monkeypatch):
+        monkeypatch.setenv("ASR_BACKEND", "whisper")
+        monkeypatch.delenv("HUGGING_FACE_TOKEN", raising=False)
+        fake_whisper.load_model.side_effect = RuntimeError("no weights")
+
+        assert preload_models().result(timeout=5) is None
+
+    def test_cpu_model_quantized_to_int8_when_enabled(self, fake_whisper, monkeypatch):
+        monkeypatch.setenv("ASR_BACKEND", "whisper")
+        monkeypatch.setenv("ASR_WHISPER_INT8", "1")
+        model = fake_whisper.load_model.return_value
+        model.device.type = "cpu"
+        model.modules.return_value = []
+        torch = MagicMock()
+        quantized = torch.quantization.quantize_dynamic.return_value
+        quantized.device.type = "cpu"
+        quantized.transcribe.return_value = {"text": "", "segments": []}
+
+        with patch.dict(sys.modules, {"torch": torch}):
+            transcribe_wav("a.wav")
+
+        torch.quantization.quantize_dynamic.assert_called_once_with(
+            model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+        )
+        quantized.transcribe.assert_called_once()
+
+    def test_cpu_quantization_off_by_default(self, fake_whisper, monkeypatch):
+        monkeypatch.setenv("ASR_BACKEND", "whisper")
+        monkeypatch.delenv("ASR_WHISPER_INT8", raising=False)
+        monkeypatch.setenv("ASR_COMPUTE_TYPE", "int8")
+        fake_whisper.load_model.return_value.device.type = "cpu"
+        torch = MagicMock()
+
+        with patch.dict(sys.modules, {"torch": torch}):
+            transcribe_wav("a.wav")
+
+        torch.quantization.quantize_dynamic.assert_not_called()
+
+    def test_default_backend_is_whisper(self, monkeypatch):
+        monkeypatch.delenv("ASR_BACKEND", raising=False)
+        with patch.object(transcription_service.importlib.util, "find_spec", return_value=MagicMock()):
+            assert transcription_service._asr_backend() == "whisper"
+
+    def test_auto_backend_prefers_faster_whisper(self, monkeypatch):
+        monkeypatch.setenv("ASR_BACKEND", "auto")
+        with patch.object(transcription_service.importlib.util, "find_spec", return_value=MagicMock()):
+            assert transcription_service._asr_backend() == "faster-whisper"
+        with patch.object(transcription_service.importlib.util, "find_spec", return_value=None):
+            assert transcription_service._asr_backend() == "whisper"
+
+    def test_unknown_backend(self, monkeypatch):
+        monkeypatch.setenv("ASR_BACKEND", "nope")
+        with pytest.raises(ValueError, match="ASR_BACKEND"):
+            transcribe_wav("a.wav")
+
+
+@pytest.fixture
+def fake_pyannote():
+    segment = MagicMock(start=0.0, end=1.0)
+    pyannote_audio = MagicMock()
+    pyannote_whisper_utils = MagicMock()
+    pyannote_whisper_utils.diarize_text.return_value = [(segment, "SPEAKER_00", "Привет")]
+    torch = MagicMock()
+    torch.cuda.is_available.return_value = False
+    modules = {
+        "torch": torch,
+        "pyannote": MagicMock(audio=pyannote_audio),
+        "pyannote.audio": pyannote_audio,
+        "pyannote_whisper": MagicMock(utils=pyannote_whisper_utils),
+        "pyannote_whisper.utils": pyannote_whisper_utils,
+    }
+    with patch.dict(sys.modules, modules):
+        yield pyannote_audio
+
+
+class TestDiarizeWav:
+    def test_pipeline_loaded_once_across_calls(self, fake_pyannote):
+        asr_result = {"text": "Привет", "segments": []}
+
+        first = diarize_wav("a.wav", asr_result, hf_token="hf")
+        diarize_wav("b.wav", asr_result, hf_token="hf")
+
+        fake_pyannote.Pipeline.from_pretrained.assert_called_once()
+        pipeline = fake_pyannote.Pipeline.from_pretrained.return_value
+        pipeline.to.assert_called_once()
+        assert pipeline.call_count == 2
+        assert first == [{"start": 0.0, "end": 1.0, "speaker": "SPEAKER_00", "text": "Привет"}]
+
+    def test_waveform_input_wrapped_for_pipeline(self, fake_pyannote):
+        torch = sys.modules["torch"]
+        audio = np.zeros(16000, dtype=np.float32)
+
+        diarize_wav(audio, {"text": "", "segments": []}, hf_token="hf")
+
+        pipeline = fake_pyannote.Pipeline.from_pretrained.return_value
+        pipeline_input = pipeline.call_args[0][0]
+        assert pipeline_input["sample_rate"] == 16000
+        torch.from_numpy.assert_called_once_with(audio)
+
+    def test_batch_sizes_raised_on_gpu(self, fake_pyannote, monkeypatch):
+        monkeypatch.delenv("DIARIZATION_BATCH_SIZE", raising=False)
+        sys.modules["torch"].cuda.is_available.return_value = True
+
+        diarize_wav("a.wav", {"text": "", "segments": []}, hf_token="hf")
+
+        pipeline = fake_pyannote.Pipeline.from_pretrained.return_value
+        assert pipeline.segmentation_batch_size == 32
+        assert pipeline.embedding_batch_size == 32
+
+    def test_batch_size_from_env(self, fake_pyannote, monkeypatch):
+        monkeypatch.setenv("DIARIZATION_BATCH_SIZE", "8")
+
+        diarize_wav("a.wav", {"text": "", "segments": []}, hf_token="hf")
+
+        pipeline = fake_pyannote.Pipeline.from_pretrained.return_value
+        assert pipeline.embedding_batch_size == 8
+
+    def test_effective_batch_size_logged(self, fake_pyannote, monkeypatch, caplog):
+        monkeypatch.setenv("DIARIZATION_BATCH_SIZE", "8")
+
+        with caplog.at_level("INFO", logger=transcription_service.__name__):
+            diarize_wav("a.wav", {"text": "", "segments": []}, hf_token="hf")
+
+        assert "Diarization embedding_batch_size: 8" in caplog.text
+
+    def test_missing_batch_size_attributes_warn(self, fake_pyannote, monkeypatch, caplog):
+        monkeypatch.setenv("DIARIZATION_BATCH_SIZE", "8")
+        fake_pyannote.Pipeline.from_pretrained.return_value = MagicMock(
+            spec=["to", "__call__"]
+        )
+
+        with caplog.at_level("WARNING", logger=transcription_service.__name__):
+            transcription_service._load_diarization_pipeline("model", "hf")
+
+        assert "DIARIZATION_BATCH_SIZE=8 not applied" in caplog.text
+
+    def test_missing_token(self, monkeypatch):
+        monkeypatch.delenv("HUGGING_FACE_TOKEN", raising=False)
+        with patch.dict(sys.modules, {"pyannote_whisper": MagicMock(), "pyannote_whisper.utils": MagicMock()}):
+            with pytest.raises(ValueError, match="HUGGING_FACE_TOKEN"):
+                diarize_wav("a.wav", {})
+
+
+class TestTranscribeAndDiarize:
+    def test_sequential_without_gpu(self, fake_whisper, fake_pyannote, monkeypatch):
+        monkeypatch.setenv("ASR_BACKEND", "whisper")
+
+        asr_result, diarized = transcribe_and_diarize("a.wav", hf_token="hf")
+
+        assert asr_result["text"] == "Привет"
+        assert diarized == [{"start": 0.0, "end": 1.0, "speaker": "SPEAKER_00", "text": "Привет"}]
+        sys.modules["torch"].cuda.Stream.assert_not_called()
+
+    def test_overlaps_on_gpu_with_free_memory(self, fake_whisper, fake_pyannote, monkeypatch):
+        monkeypatch.setenv("ASR_BACKEND", "whisper")
+        torch = sys.modules["torch"]
+        torch.cuda.is_available.return_value = True
+        torch.cuda.mem_get_info.return_value = (16 * 1024**3, 24 * 1024**3)
+
+        asr_result, diarized = transcribe_and_diarize("a.wav", hf_token="hf")
+
+        torch.cuda.Stream.assert_called_once()
+        torch.cuda.Stream.return_value.synchronize.assert_called_once()
+        pyannote_utils = sys.modules["pyannote_whisper.utils"]
+        assert pyannote_utils.diarize_text.call_args[0][0] is asr_result
+        assert len(diarized) == 1
+
+    def test_sequential_when_gpu_memory_is_low(self, fake_whisper, fake_pyannote, monkeypatch):
+        monkeypatch.setenv("ASR_BACKEND", "whisper")
+        torch = sys.modules["torch"]
+        torch.cuda.is_available.return_value = True
+        torch.cuda.mem_get_info.return_value = (1024**3, 24 * 1024**3)
+
+        transcribe_and_diarize("a.wav", hf_token="hf")
+
+        torch.cuda.Stream.assert_not_called()
+
+    @pytest.mark.parametrize("free_vram", [1024**3, 16 * 1024**3])
+    def test_asr_reported_before_diarization_failure(self, fake_whisper, fake_pyannote, monkeypatch, free_vram):
+        monkeypatch.setenv("ASR_BACKEND", "whisper")
+        torch = sys.modules["torch"]
+        torch.cuda.is_available.return_value = True
+        torch.cuda.mem_get_info.return_value = (free_vram, 24 * 1024**3)
+        fake_pyannote.Pipeline.from_pretrained.return_value.side_effect = RuntimeError("OOM")
+        reported = []
+
+        with pytest.raises(RuntimeError, match="OOM"):
+            transcribe_and_diarize("a.wav", hf_token="hf", on_asr=reported.append)
+
+        assert [r["text"] for r in reported] == ["Привет"]
+
+    def test_missing_token_fails_before_asr(self, fake_whisper, monkeypatch):
+        monkeypatch.delenv("HUGGING_FACE_TOKEN", raising=False)
+
+        with pytest.raises(ValueError, match="HUGGING_FACE_TOKEN"):
+            transcribe_and_diarize("a.wav")
+
+        fake_whisper.load_model.assert_not_called()
+
+
+class TestTranscriptCacheKey:
+    @pytest.fixture
+    def audio(self):
+        return np.zeros(16000, dtype=np.float32)
+
+    @pytest.mark.parametrize("name, value", [
+        ("ASR_WHISPER_MODEL", "small"),
+        ("ASR_WHISPER_INT8", "1"),
+        ("DIARIZATION_BATCH_SIZE", "8"),
+    ])
+    def test_whisper_settings_change_key(self, audio, monkeypatch, name, value):
+        monkeypatch.setenv("ASR_BACKEND", "whisper")
+        for var in ("ASR_WHISPER_MODEL", "ASR_WHISPER_INT8", "DIARIZATION_BATCH_SIZE"):
+            monkeypatch.delenv(var, raising=False)
+        key = transcription_service.transcript_cache_key(audio, "ru")
+        assert transcription_service.transcript_cache_key(audio, "russian") == key
+
+        monkeypatch.setenv(name, value)
+
+        assert transcription_service.transcript_cache_key(audio, "ru") != key
+
+    @pytest.mark.parametrize("name, value", [
+        ("ASR_BEAM_SIZE", "5"),
+        ("ASR_VAD_FILTER", "0"),
+        ("ASR_BATCH_SIZE", "4"),
+    ])
+    def test_faster_whisper_settings_change_key(self, audio, fake_faster_whisper, monkeypatch, name, value):
+        monkeypatch.setenv("ASR_BACKEND", "faster-whisper")
+        for var in ("ASR_BEAM_SIZE", "ASR_VAD_FILTER", "ASR_BATCH_SIZE"):
+            monkeypatch.delenv(var, raising=False)
+        key = transcription_service.transcript_cache_key(audio)
+
+        monkeypatch.setenv(name, value)
+
+        assert transcription_service.transcript_cache_key(audio) != key
+
+    def test_version_changes_key(self, audio, monkeypatch):
+        monkeypatch.setenv("ASR_BACKEND", "whisper")
+        key = transcription_service.transcript_cache_key(audio)
+
+        monkeypatch.setattr(
+            transcription_service, "TRANSCRIPT_CACHE_VERSION",
+            transcription_service.TRANSCRIPT_CACHE_VERSION + 1,
+        )
+
+        assert transcription_service.transcript_cache_key(audio) != key
+
+
+Seg = namedtuple("Seg", "start end")
+
+
+class FakeAnnotation:
+    def __init__(self, turns):
+        self.turns = turns
+        self.uri = "talk"
+
+    def itertracks(self, yield_label=False):
+        for i, (start, end, label) in enumerate(self.turns):
+            yield Seg(start, end), i, label
+
+    def crop(self, support):
+        raise AssertionError("full crop should not be needed for argmax")
+
+
+def _brute_force_speaker(turns, start, end):
+    durations = {}
+    for t_start, t_end, label in turns:
+        overlap = min(t_end, end) - max(t_start, start)
+        if overlap > 0:
+            durations[label] = durations.get(label, 0.0) + overlap
+    if not durations:
+        return None
+    return max(sorted(durations), key=durations.get)
+
+
+class TestSpeakerTimeline:
+    def test_matches_brute_force_overlap(self):
+        rng = random.Random(0)
+        turns = []
+        for _ in range(200):
+            start = rng.uniform(0, 600)
+            turns.append((start, start + rng.uniform(0.1, 60), rng.choice(["A", "B", "C"])))
+        timeline = transcription_service._SpeakerTimeline(FakeAnnotation(turns))
+
+        for _ in range(500):
+            start = rng.uniform(-10, 650)
+            end = start + rng.uniform(0.1, 20)
+            expected = _brute_force_speaker(turns, start, end)
+            assert timeline.crop(Seg(start, end)).argmax() == expected
+
+    def test_no_overlap_and_delegation(self):
+        timeline = transcription_service._SpeakerTimeline(FakeAnnotation([(0.0, 1.0, "A")]))
+
+        assert timeline.crop(Seg(2.0, 3.0)).argmax() is None
+        assert timeline.uri == "talk"
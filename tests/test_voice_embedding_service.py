@@ -33,7 +33,7 @@ def mock_transcript():
 @pytest.fixture
 def voice_service():
     """Create a VoiceEmbeddingService instance for testing."""
-    return VoiceEmbeddingService()
+    return VoiceEmbeddingService(warmup=False)
 
 def test_extract_embedding(voice_service):
     """Test extracting voice embedding from an audio segment."""
@@ -152,6 +152,7 @@ def test_process_audio_file_mp4(mock_get_embeddings, convert_mock, voice_service
         'SPEAKER_2': [np.random.rand(256).astype(np.float32) for _ in range(2)]
     }
     mock_get_embeddings.return_value = mock_embeddings
+    convert_mock.side_effect = lambda src, dst: open(dst, 'wb').close()
     
     # Test processing
     mean_embeddings = voice_service.process_audio_file(
@@ -167,6 +168,7 @@ def test_process_audio_file_mp4(mock_get_embeddings, convert_mock, voice_service
     
     # Cleanup
     os.unlink(mp4_path)
+    os.unlink(os.path.splitext(mp4_path)[0] + '.wav')
 
 def test_process_audio_file_no_embeddings(voice_service, mock_audio, mock_transcript):
     """Test processing when no valid embeddings can be extracted."""
@@ -181,4 +183,60 @@ def test_process_audio_file_no_embeddings(voice_service, mock_audio, mock_transc
     )
     
     assert isinstance(mean_embeddings, dict)
-    assert len(mean_embeddings) == 0 
\ No newline at end of file
+    assert len(mean_embeddings) == 0
+
+
+@patch('webinar_processor.services.voice_embedding_service.convert_mp4_to_wav')
+@patch.object(VoiceEmbeddingService, 'get_speaker_embeddings')
+def test_process_audio_file_mp4_reuses_existing_wav(mock_get_embeddings, convert_mock, voice_service, mock_transcript, tmp_path):
+    """Test that an existing sibling WAV is reused instead of re-converting."""
+    mp4_path = tmp_path / "webinar.mp4"
+    mp4_path.touch()
+    wav_path = tmp_path / "webinar.wav"
+    wav_path.touch()
+    os.utime(mp4_path, (1000, 1000))
+    os.utime(wav_path, (2000, 2000))
+    mock_get_embeddings.return_value = {}
+
+    voice_service.process_audio_file(str(mp4_path), mock_transcript)
+
+    assert not convert_mock.called
+    assert mock_get_embeddings.call_args[0][0] == str(wav_path)
+
+
+@patch('webinar_processor.services.voice_embedding_service.convert_mp4_to_wav')
+@patch.object(VoiceEmbeddingService, 'get_speaker_embeddings')
+def test_process_audio_file_mp4_reconverts_stale_wav(mock_get_embeddings, convert_mock, voice_service, mock_transcript, tmp_path):
+    """Test that a WAV older than its source is replaced by a fresh conversion."""
+    mp4_path = tmp_path / "webinar.mp4"
+    mp4_path.touch()
+    wav_path = tmp_path / "webinar.wav"
+    wav_path.write_bytes(b"old")
+    os.utime(wav_path, (1000, 1000))
+    os.utime(mp4_path, (2000, 2000))
+    convert_mock.side_effect = lambda src, dst: open(dst, 'wb').write(b"new")
+    mock_get_embeddings.return_value = {}
+
+    voice_service.process_audio_file(str(mp4_path), mock_transcript)
+
+    assert convert_mock.call_args[0] == (str(mp4_path), str(tmp_path / "webinar.part.wav"))
+    assert wav_path.read_bytes() == b"new"
+    assert not (tmp_path / "webinar.part.wav").exists()
+
+
+@patch('webinar_processor.services.voice_embedding_service.convert_mp4_to_wav')
+def test_process_audio_file_failed_conversion_leaves_no_wav(convert_mock, voice_service, mock_transcript, tmp_path):
+    """Test that a failed ffmpeg run leaves nothing a later run could reuse."""
+    mp4_path = tmp_path / "webinar.mp4"
+    mp4_path.touch()
+
+    def truncated(src, dst):
+        open(dst, 'wb').write(b"RIFF")
+        raise RuntimeError("ffmpeg killed")
+
+    convert_mock.side_effect = truncated
+
+    with pytest.raises(RuntimeError):
+        voice_service.process_audio_file(str(mp4_path), mock_transcript)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["webinar.mp4"]
@@ -0,0 +1,73 @@
+"""
+Cache Utility Tests
+===================
+
+This module tests the persistent result cache helpers.
+
+Test Verification Strategy
+-------------------------
+- Verify cache keys depend on the audio samples and every parameter
+- Verify stored values round-trip and missing or corrupt entries read as None
+- Verify the cache lives under XDG_CACHE_HOME
+- Verify numpy values are stored and unserializable values never raise
+"""
+
+import os
+
+import numpy as np
+
+from webinar_processor.utils.cache import (
+    audio_cache_key,
+    load_cached,
+    store_cached,
+    user_cache_dir,
+)
+
+
+def test_audio_cache_key_depends_on_samples_and_params():
+    """Test that equal audio shares a key and any difference changes it."""
+    audio = np.linspace(-1, 1, 1600, dtype=np.float32)
+
+    key = audio_cache_key(audio, "russian", "large-v3")
+
+    assert key == audio_cache_key(audio.copy(), "russian", "large-v3")
+    assert key != audio_cache_key(audio, "english", "large-v3")
+    assert key != audio_cache_key(audio[::-1], "russian", "large-v3")
+    # Parameter boundaries are delimited, not just concatenated
+    assert audio_cache_key(audio, "ab", "c") != audio_cache_key(audio, "a", "bc")
+
+
+def test_store_and_load_round_trip(monkeypatch, tmp_path):
+    """Test that a stored value is loaded back from the user cache dir."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    value = {"asr": {"text": "Привет"}, "transcript": [{"start": 0.0, "end": 1.0}]}
+
+    store_cached("transcripts", "abc", value)
+
+    assert load_cached("transcripts", "abc") == value
+    assert os.path.exists(tmp_path / "webinar-processor" / "transcripts" / "abc.json")
+    assert user_cache_dir("transcripts") == str(tmp_path / "webinar-processor" / "transcripts")
+
+
+def test_missing_and_corrupt_entries_read_as_none(monkeypatch, tmp_path):
+    """Test that absent or unreadable entries are treated as cache misses."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert load_cached("transcripts", "missing") is None
+
+    path = tmp_path / "webinar-processor" / "transcripts"
+    path.mkdir(parents=True)
+    (path / "bad.json").write_bytes(b"{not json")
+
+    assert load_cached("transcripts", "bad") is None
+
+
+def test_store_numpy_values_and_unserializable_is_logged(monkeypatch, tmp_path):
+    """Test that numpy results are cached and encoding failures don't raise."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    store_cached("transcripts", "np", {"start": np.float32(1.5), "tokens": np.arange(2)})
+    store_cached("transcripts", "bad", {"value": object()})
+
+    assert load_cached("transcripts", "np") == {"start": 1.5, "tokens": [0, 1]}
+    assert load_cached("transcripts", "bad") is None
+    assert not [p for p in os.listdir(tmp_path / "webinar-processor" / "transcripts") if p.endswith(".tmp")]
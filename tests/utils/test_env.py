@@ -0,0 +1,48 @@
+"""
+Environment Loading Tests
+=========================
+
+This module tests the cached .env loader.
+
+Test Verification Strategy
+-------------------------
+- Verify the .env file in the working directory is loaded
+- Verify repeated calls do not search for or parse the file again
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from webinar_processor.utils import env
+
+
+@pytest.fixture(autouse=True)
+def clear_env_cache():
+    """Reset the load cache around each test."""
+    env.load_env.cache_clear()
+    yield
+    env.load_env.cache_clear()
+
+
+def test_load_env_reads_cwd_dotenv(tmp_path, monkeypatch):
+    """Test that variables from ./.env are loaded."""
+    (tmp_path / ".env").write_text("EDU_PATH_TEST_TOKEN=secret\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    # setenv first so monkeypatch restores (removes) the variable afterwards
+    monkeypatch.setenv("EDU_PATH_TEST_TOKEN", "")
+    monkeypatch.delenv("EDU_PATH_TEST_TOKEN")
+
+    assert env.load_env() is True
+    assert os.environ["EDU_PATH_TEST_TOKEN"] == "secret"
+
+
+def test_load_env_runs_once(tmp_path, monkeypatch):
+    """Test that repeated calls reuse the first result."""
+    monkeypatch.chdir(tmp_path)
+    with patch.object(env, "find_dotenv", return_value="") as find:
+        env.load_env()
+        env.load_env()
+
+    find.assert_called_once_with(usecwd=True)
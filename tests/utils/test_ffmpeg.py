@@ -0,0 +1,59 @@
+"""
+FFmpeg Utility Tests
+====================
+
+This module tests ffmpeg command helpers without invoking ffmpeg.
+
+Test Verification Strategy
+-------------------------
+- Verify PCM output from the ffmpeg pipe is decoded to float32 samples
+- Verify optional normalization adds the loudness filter
+"""
+
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from webinar_processor.utils.ffmpeg import load_audio
+
+
+def test_load_audio_decodes_pcm():
+    """Test that s16le bytes from ffmpeg stdout become a float32 waveform."""
+    pcm = np.array([0, 16384, -32768], dtype=np.int16).tobytes()
+    with patch("webinar_processor.utils.ffmpeg.subprocess.run", return_value=Mock(stdout=pcm)) as run:
+        audio = load_audio("talk.mp4")
+
+    assert audio.dtype == np.float32
+    np.testing.assert_allclose(audio, [0.0, 0.5, -1.0])
+    cmd = run.call_args[0][0]
+    assert cmd[-1] == "-" and "s16le" in cmd and "-af" not in cmd
+
+
+def test_load_audio_decodes_audio_stream_only():
+    """Test that video, subtitle and data streams are not decoded."""
+    with patch("webinar_processor.utils.ffmpeg.subprocess.run", return_value=Mock(stdout=b"")) as run:
+        load_audio("talk.mp4")
+
+    cmd = run.call_args[0][0]
+    assert cmd[cmd.index("-map") + 1] == "0:a:0"
+    assert {"-vn", "-sn", "-dn"} <= set(cmd)
+
+
+def test_load_audio_slice_seeks_input():
+    """Test that start/duration are passed as input options before -i."""
+    with patch("webinar_processor.utils.ffmpeg.subprocess.run", return_value=Mock(stdout=b"")) as run:
+        load_audio("talk.mp4", start=12.5, duration=30)
+
+    cmd = run.call_args[0][0]
+    assert cmd[cmd.index("-ss") + 1] == "12.5"
+    assert cmd[cmd.index("-t") + 1] == "30"
+    assert cmd.index("-ss") < cmd.index("-i")
+
+
+def test_load_audio_normalize_adds_filter():
+    """Test that normalize=True applies the loudness filter chain."""
+    with patch("webinar_processor.utils.ffmpeg.subprocess.run", return_value=Mock(stdout=b"")) as run:
+        load_audio("talk.mp4", normalize=True)
+
+    cmd = run.call_args[0][0]
+    assert "loudnorm" in cmd[cmd.index("-af") + 1]
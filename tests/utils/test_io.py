@@ -0,0 +1,87 @@
+"""
+I/O Utility Tests
+=================
+
+This module tests shared file helpers used by CLI commands.
+
+Test Verification Strategy
+-------------------------
+- Verify JSON files round-trip, including non-ASCII text
+- Verify invalid JSON raises the standard json.JSONDecodeError
+- Verify written JSON keeps non-ASCII text readable and the existing layout
+- Verify streamed output only appears once the stream completes
+"""
+
+import json
+
+import pytest
+
+from webinar_processor.utils.io import compile_template, load_json, stream_output, write_json
+
+
+def test_load_json(tmp_path):
+    """Test loading a UTF-8 JSON transcript."""
+    path = tmp_path / "asr.json"
+    path.write_text(json.dumps({"text": "Привет, мир"}, ensure_ascii=False), encoding="utf-8")
+    assert load_json(str(path)) == {"text": "Привет, мир"}
+
+
+def test_load_json_invalid(tmp_path):
+    """Test that malformed JSON raises json.JSONDecodeError for existing handlers."""
+    path = tmp_path / "bad.json"
+    path.write_text("{not json", encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        load_json(str(path))
+
+
+def test_write_json_keeps_layout(tmp_path):
+    """Test that written transcripts match the json.dump(indent=4) layout byte for byte."""
+    path = tmp_path / "transcript.json"
+    data = [{"start": 1.5, "speaker": "SPEAKER_00", "text": "Привет"}]
+
+    write_json(str(path), data)
+
+    assert path.read_text(encoding="utf-8") == json.dumps(data, ensure_ascii=False, indent=4)
+
+
+def test_compile_template_matches_format():
+    """Test that compiled templates render like str.format, including escaped braces."""
+    template = "Часть {chunk_index} из {total}:\n{text}\nJSON: {{\"k\": 1}}"
+    render = compile_template(template)
+    kwargs = {"chunk_index": 2, "total": 5, "text": "{not a field}"}
+    assert render(**kwargs) == template.format(**kwargs)
+
+
+def test_compile_template_missing_field():
+    """Test that a missing field raises KeyError like str.format."""
+    with pytest.raises(KeyError):
+        compile_template("{text}")()
+
+
+def test_compile_template_format_spec_falls_back():
+    """Test that templates with format specs still render via str.format."""
+    assert compile_template("{x:.2f}")(x=1.5) == "1.50"
+
+
+def test_stream_output_writes_file(tmp_path):
+    """Test that streamed chunks end up in the output file."""
+    path = tmp_path / "summary.txt"
+
+    assert stream_output(iter(["При", "вет"]), str(path)) == "Привет"
+
+    assert path.read_text(encoding="utf-8") == "Привет"
+    assert not (tmp_path / "summary.txt.part").exists()
+
+
+def test_stream_output_failure_leaves_no_file(tmp_path):
+    """Test that a stream failing part-way leaves neither output nor partial file."""
+    path = tmp_path / "summary.txt"
+
+    def chunks():
+        yield "Начало"
+        raise RuntimeError("connection reset")
+
+    with pytest.raises(RuntimeError):
+        stream_output(chunks(), str(path))
+
+    assert list(tmp_path.iterdir()) == []
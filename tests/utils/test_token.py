@@ -0,0 +1,91 @@
+"""
+Token Utility Tests
+===================
+
+This module tests token counting helpers.
+
+Test Verification Strategy
+-------------------------
+- Verify the tiktoken encoding is built once per model and reused
+- Verify unknown models fall back to the gpt-4o encoding
+- Verify the BPE cache defaults to a persistent directory
+"""
+
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+from webinar_processor.utils import token
+
+
+@pytest.fixture(autouse=True)
+def clear_encoding_cache():
+    """Reset the encoding cache around each test."""
+    token._get_encoding.cache_clear()
+    yield
+    token._get_encoding.cache_clear()
+
+
+def test_count_tokens_reuses_encoding():
+    """Test that repeated calls build the encoding only once."""
+    encoding = Mock()
+    encoding.encode_ordinary.return_value = [1, 2, 3]
+    with patch("tiktoken.encoding_for_model", return_value=encoding) as factory:
+        assert token.count_tokens("gpt-4o", "a b c") == 3
+        assert token.count_tokens("gpt-4o", "d e f") == 3
+
+    factory.assert_called_once_with("gpt-4o")
+
+
+def test_count_tokens_unknown_model_falls_back():
+    """Test that an unknown model uses the gpt-4o encoding."""
+    encoding = Mock()
+    encoding.encode_ordinary.return_value = [1]
+
+    def factory(model):
+        if model != "gpt-4o":
+            raise KeyError(model)
+        return encoding
+
+    with patch("tiktoken.encoding_for_model", side_effect=factory):
+        assert token.count_tokens("custom-model", "x") == 1
+
+
+def test_count_tokens_batch_uses_encode_batch():
+    """Test that batch counting encodes all texts in a single call."""
+    encoding = Mock()
+    encoding.encode_ordinary_batch.return_value = [[1, 2], [3], []]
+    with patch("tiktoken.encoding_for_model", return_value=encoding):
+        assert token.count_tokens_batch("gpt-4o", iter(["ab", "c", ""])) == [2, 1, 0]
+
+    encoding.encode_ordinary_batch.assert_called_once_with(["ab", "c", ""])
+    encoding.encode_ordinary.assert_not_called()
+
+
+def test_count_tokens_ignores_special_token_markers():
+    """Test that special-token text is counted instead of raising."""
+    encoding = Mock()
+    encoding.encode.side_effect = ValueError("disallowed special token")
+    encoding.encode_ordinary.return_value = [1, 2, 3, 4]
+    with patch("tiktoken.encoding_for_model", return_value=encoding):
+        assert token.count_tokens("gpt-4o", "<|endoftext|>") == 4
+
+
+def test_encoding_cache_dir_defaults_to_user_cache(monkeypatch, tmp_path):
+    """Test that TIKTOKEN_CACHE_DIR is set to a persistent per-user directory."""
+    monkeypatch.delenv("TIKTOKEN_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    with patch("tiktoken.encoding_for_model", return_value=Mock()):
+        token._get_encoding("gpt-4o")
+
+    assert os.environ["TIKTOKEN_CACHE_DIR"] == str(tmp_path / "webinar-processor" / "tiktoken")
+
+
+def test_encoding_cache_dir_respects_user_setting(monkeypatch, tmp_path):
+    """Test that an explicit TIKTOKEN_CACHE_DIR is left untouched."""
+    monkeypatch.setenv("TIKTOKEN_CACHE_DIR", str(tmp_path))
+    with patch("tiktoken.encoding_for_model", return_value=Mock()):
+        token._get_encoding("gpt-4o")
+
+    assert os.environ["TIKTOKEN_CACHE_DIR"] == str(tmp_path)
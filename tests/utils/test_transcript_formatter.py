@@ -0,0 +1,30 @@
+"""
+Transcript Formatter Tests
+==========================
+
+This module tests sentence and paragraph helpers for flat transcripts.
+
+Test Verification Strategy
+-------------------------
+- Verify sentences split only before an uppercase letter
+- Verify paragraph grouping keeps every sentence
+"""
+
+from webinar_processor.utils.transcript_formatter import add_paragraph_breaks, split_sentences
+
+
+def test_split_sentences():
+    """Test splitting on terminal punctuation followed by an uppercase letter."""
+    text = "Привет. Это тест! Ёлка растёт? Yes. т.е. не разрывать"
+    assert split_sentences(text) == ["Привет.", "Это тест!", "Ёлка растёт?", "Yes. т.е. не разрывать"]
+
+
+def test_add_paragraph_breaks():
+    """Test that sentences are grouped into paragraphs."""
+    text = "Раз. Два. Три. Четыре."
+    assert add_paragraph_breaks(text, sentences_per_paragraph=2) == "Раз. Два.\n\nТри. Четыре."
+
+
+def test_split_sentences_ellipsis():
+    """Test that an ellipsis also ends a sentence."""
+    assert split_sentences("Ну… Давайте начнём.") == ["Ну…", "Давайте начнём."]